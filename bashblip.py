@@ -3,39 +3,129 @@
 bash_blip: Modular real-time ASCII audio visualizer.
 """
 
+import time
+_T_START = time.perf_counter()  # before the heavy imports, for --profile-startup
+
 import os
 import sys
 import argparse
-from core import AudioEngine, get_default_monitor
+from core import AudioEngine, AnalysisThread, FrameGovernor, get_default_monitor, WINDOWS
+from core import ParecSource, PCMFileSource, SyntheticSource
+from core.display import DiffRenderer, FullRenderer
+from core.offline import load_audio, render_offline
+from core.recording import EnergyRecorder, ReplayThread
+from core.timing import StageTimer, StartupProfile
 from skins import SKINS
+from skins.adaptive import AdaptiveQuality
 import random
 import termios
 import tty
 import select
 from colorama import init, Fore, Style
-import time
 import atexit
 
 
 init(autoreset=True)
 
+RENDER_FPS = 60  # default render rate when capture runs on its own thread
+
+keyboard = sys.stdin  # /dev/tty instead when audio arrives on stdin
+old_settings = None
+
 def key_pressed():
     """Return one key if pressed, else None (non-blocking)."""
-    dr, dw, de = select.select([sys.stdin], [], [], 0)
+    dr, dw, de = select.select([keyboard], [], [], 0)
     if dr:
-        return sys.stdin.read(1)
+        return keyboard.read(1)
     return None
 
-old_settings = termios.tcgetattr(sys.stdin)
-tty.setcbreak(sys.stdin.fileno())
+def setup_terminal(keys):
+    """Read single key presses from `keys` and restore it on exit."""
+    global keyboard, old_settings
+    keyboard = keys
+    old_settings = termios.tcgetattr(keys)
+    tty.setcbreak(keys.fileno())
+    atexit.register(restore_terminal)
+
 def restore_terminal():
-    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+    if old_settings is not None:
+        termios.tcsetattr(keyboard, termios.TCSADRAIN, old_settings)
     sys.stdout.write("\033[?25h\033[2J\033[H")  # restore cursor and clear
     sys.stdout.flush()
 
-atexit.register(restore_terminal)
+def draw(skin, norm_energies, renderer, timer=None, overlay=False):
+    """Render one frame with `skin` and write it to the terminal.
+
+    With a `timer`, the render and write stages are timed, and `overlay`
+    draws the timer's table over the frame.
+    """
+    try:
+        start = time.perf_counter()
+        screen = skin.render(norm_energies)
+        if timer:
+            rendered = time.perf_counter()
+            timer.add("render", rendered - start)
+            if overlay:
+                screen = timer.overlay(screen)
+        renderer.draw(screen)
+        if timer:
+            timer.add("write", time.perf_counter() - rendered)
+    except Exception as e:
+        renderer.reset()
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.write(f"[!] Error in skin '{skin.name}': {e}\n")
+        import traceback
+        tb = ''.join(traceback.format_exc())
+        sys.stdout.write(tb + "\n")
+        sys.stdout.flush()
+        time.sleep(1)  # pause briefly so you can read the error
+
+def parse_size(text):
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+def check_hop(parser, args, num_bands):
+    """Reject a --window-size or --hop the engine can't honor, before the terminal is touched."""
+    if args.window_size is not None and args.window_size <= 0:
+        parser.error("--window-size must be a positive number of samples")
+    if args.hop is None:
+        return
+    window = AudioEngine.default_window_size(num_bands) if args.window_size is None else args.window_size
+    if args.hop <= 0:
+        parser.error("--hop must be a positive number of samples")
+    if args.hop > window:
+        parser.error(f"--hop {args.hop} is larger than the {window}-sample analysis window")
+
+def render_file(args, samples, rate, width, height):
+    """Offline mode: render every frame of --input into --render-to, unpaced."""
+    bar_height = max(4, height - 2)
+    num_bands = max(8, width - 2)
+    engine = AudioEngine(
+        num_bands=num_bands,
+        rate=rate,
+        balance_gain_factor=args.gain,
+        split_freq=args.split_freq,
+        headroom_factor=args.headroom,
+        window_size=args.window_size,
+        hop_size=args.hop,
+        window=args.window
+    )
+    skin = SKINS[args.skin](bar_height, num_bands)
+    recorder = EnergyRecorder(args.record, num_bands) if args.record else None
+    try:
+        count, elapsed = render_offline(engine, samples, skin, args.render_to, width, height, recorder)
+    finally:
+        if recorder:
+            recorder.close()
+    duration = len(samples) / rate
+    fps = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{count} frames of {args.skin} at {width}x{height} from {duration:.1f}s of audio "
+          f"in {elapsed:.2f}s: {fps:.1f} frames/sec ({duration / max(elapsed, 1e-9):.1f}x realtime)")
 
 def main():
+    profile = StartupProfile(_T_START)
+    profile.mark("imports")
+
     parser = argparse.ArgumentParser(description="Modular ASCII audio visualizer.")
     parser.add_argument(
         "--skin",
@@ -63,6 +153,105 @@ def main():
         default=1.5,
         help="Per-band headroom factor. Higher = less clipping (default: 1.5)"
     )
+    parser.add_argument(
+        "--window-size",
+        type=int,
+        default=None,
+        help="FFT window size in samples (default: scales with terminal width)"
+    )
+    parser.add_argument(
+        "--hop",
+        type=int,
+        default=None,
+        help="Samples between successive FFTs, at most the window size; smaller than the window = overlapping analysis (default: window size)"
+    )
+    parser.add_argument(
+        "--window",
+        choices=list(WINDOWS.keys()),
+        default="rect",
+        help="Analysis window function (default: rect)"
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="Capture and analyze audio on a background thread, rendering at --fps"
+    )
+    parser.add_argument(
+        "--full-redraw",
+        action="store_true",
+        help="Rewrite the whole screen every frame instead of only the cells that changed"
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=None,
+        help=f"Maximum frames drawn per second; 0 draws every audio frame (default: 0, or {RENDER_FPS} with --threaded)"
+    )
+
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--device",
+        default=None,
+        help="PulseAudio source to capture with parec (default: monitor of the default sink)"
+    )
+    source.add_argument(
+        "--input",
+        metavar="PATH",
+        default=None,
+        help="Read raw mono s16le PCM at 22050 Hz from a file, FIFO, or '-' for stdin "
+             "(with --render-to, also a WAV file)"
+    )
+    source.add_argument(
+        "--synth",
+        choices=SyntheticSource.SIGNALS,
+        default=None,
+        help="Visualize a generated test signal instead of captured audio"
+    )
+    source.add_argument(
+        "--replay",
+        metavar="FILE",
+        default=None,
+        help="Play back energies saved with --record instead of analyzing audio"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        default=None,
+        help="Save every analyzed energy vector, with timestamps, to FILE for --replay or bench.py"
+    )
+    parser.add_argument(
+        "--render-to",
+        metavar="OUT",
+        default=None,
+        help="Offline mode: render --input (WAV or raw s16le) into OUT as fast as possible; "
+             "OUT ending in .cast is written as an asciinema recording"
+    )
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        default=None,
+        help="Canvas size as COLSxROWS for --render-to (default: terminal size)"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Render slow skins at reduced resolution while they miss their frame budget "
+             "(half the --fps interval, or of 30 fps when uncapped)"
+    )
+    parser.add_argument(
+        "--instrument",
+        metavar="JSON",
+        nargs="?",
+        const="",
+        default=None,
+        help="Time the read/fft/bands/render/write stages and show their p50/p99 (toggle with 'p'); "
+             "with a path, also write the stats there as JSON on exit"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Exit after the first frame and print how long each startup phase took"
+    )
 
     args = parser.parse_args()
 
@@ -73,72 +262,195 @@ def main():
     except OSError:
         height, width = 24, 80
 
+    if args.render_to:
+        if not args.input:
+            parser.error("--render-to needs an --input file")
+        width, height = args.size or (width, height)
+        check_hop(parser, args, max(8, width - 2))
+        try:
+            samples, rate = load_audio(args.input)
+        except (OSError, ValueError) as e:
+            parser.error(f"can't read --input {args.input}: {e}")
+        render_file(args, samples, rate, width, height)
+        return
+
     bar_height = max(4, height - 2)
     num_bands = max(8, width - 2)
+    check_hop(parser, args, num_bands)
+    replay = None
+    if args.replay:
+        if args.record:
+            parser.error("--record saves analyzed audio, so it can't be combined with --replay")
+        try:
+            replay = ReplayThread(args.replay, num_bands)
+        except (OSError, ValueError) as e:
+            parser.error(f"can't read --replay {args.replay}: {e}")
+        if len(replay.times) == 0:
+            parser.error(f"--replay {args.replay} holds no frames")
+    profile.mark("arguments")
+
+    # keys come from the terminal itself when stdin carries the audio
+    setup_terminal(open("/dev/tty") if args.input == "-" else sys.stdin)
 
     # Initialize
-    try:
-        device = get_default_monitor()
-    except Exception:
-        sys.exit(1)
+    if args.replay:
+        source = None
+    elif args.input:
+        source = PCMFileSource(args.input)
+    elif args.synth:
+        source = SyntheticSource(args.synth)
+    else:
+        try:
+            source = ParecSource(args.device or get_default_monitor())
+        except Exception:
+            sys.exit(1)
+    profile.mark("device detection")
 
-    engine = AudioEngine(
-        num_bands=num_bands,
-        balance_gain_factor=args.gain,
-        split_freq=args.split_freq,
-        headroom_factor=args.headroom
-    )
-    engine.start_stream(device)
+    engine = recorder = None
+    if source:
+        engine = AudioEngine(
+            num_bands=num_bands,
+            balance_gain_factor=args.gain,
+            split_freq=args.split_freq,
+            headroom_factor=args.headroom,
+            latest_only=True,
+            window_size=args.window_size,
+            hop_size=args.hop,
+            window=args.window
+        )
+        profile.mark("engine construction")
+        engine.start_stream(source)
+        profile.mark("audio stream")
+        if args.record:
+            recorder = EnergyRecorder(args.record, num_bands)
     # Find requested skin index (default to 0 if not found)
-    skins_list = [SKINS[name](bar_height, num_bands) for name in SKINS]
+    skin_names = list(SKINS)
     try:
-        current_idx = list(SKINS.keys()).index(args.skin)
+        current_idx = skin_names.index(args.skin)
     except ValueError:
         current_idx = 0
 
-    skin = skins_list[current_idx]
+    # skins are built the first time they are shown, then kept
+    loaded_skins = {}
+    # frames are paced by --fps, or by RENDER_FPS when audio arrives from another thread
+    fps = args.fps
+    if fps is None and (replay or args.threaded):
+        fps = RENDER_FPS
+    render_budget = 0.5 / (fps or 30)  # half the frame interval; uncapped counts as 30 fps
+    def load_skin(name):
+        if name not in loaded_skins:
+            skin = SKINS[name](bar_height, num_bands)
+            if args.adaptive:
+                skin = AdaptiveQuality(skin, render_budget)
+            loaded_skins[name] = skin
+        return loaded_skins[name]
+
+    skin = load_skin(skin_names[current_idx])
+    profile.mark("skin construction")
+    renderer = FullRenderer(sys.stdout) if args.full_redraw else DiffRenderer(sys.stdout)
     sys.stdout.write("\033[?25l")  # Hide cursor
     sys.stdout.flush()
+    pipeline = None
+    # stage timing starts with --instrument or the first 'p'
+    timer = StageTimer() if args.instrument is not None else None
+    show_timing = timer is not None
+    if engine:
+        engine.timer = timer
     try:
-        old_settings = termios.tcgetattr(sys.stdin)
-        tty.setcbreak(sys.stdin.fileno())
+        if replay:
+            pipeline = replay
+        elif args.threaded:
+            pipeline = AnalysisThread(engine, recorder=recorder)
+        if pipeline:
+            pipeline.start()
+        governor = FrameGovernor(fps)
+        seq = 0
+        pending = None  # newest spectrum not yet drawn
+        first_frame = True
+
+        last_draw = None
 
         while True:
+            # sleep until a key, new audio or the next render deadline
+            watch = [keyboard]
+            if pending is not None:
+                timeout = governor.timeout()
+            elif pipeline:
+                timeout = None
+                watch.append(pipeline.mailbox)  # readable once a new spectrum is published
+            else:
+                timeout = None
+                if not engine.eof:
+                    watch.append(engine.fileno())
+            select.select(watch, [], [], timeout)
+
             # check for keypress
             key = key_pressed()
             if key:
                 if key.lower() == 's':
-                    current_idx = (current_idx + 1) % len(skins_list)
-                    skin = skins_list[current_idx]
+                    current_idx = (current_idx + 1) % len(skin_names)
+                    skin = load_skin(skin_names[current_idx])
+                    renderer.reset()
                     sys.stdout.write(f"\033[2J\033[H[Switched skin → {skin.name}]\n")
                     sys.stdout.flush()
+                elif key.lower() == 'p':
+                    if timer is None:
+                        timer = StageTimer()
+                        if engine:
+                            engine.timer = timer
+                    show_timing = not show_timing
                 elif key.lower() == 'q':
                     break  # optional quit shortcut
 
+            if pipeline:
+                new_seq, norm_energies = pipeline.mailbox.get()
+                if new_seq != seq:
+                    seq, pending = new_seq, norm_energies
+            else:
+                start = time.perf_counter()
+                raw = engine.read_frame()
+                if raw is not None:
+                    if timer:
+                        timer.add("read", time.perf_counter() - start)
+                    pending = engine.process(raw)
+                    if recorder:
+                        recorder.write(pending)
 
-            engine.read_frame()
-            raw = engine.read_frame()
-            if raw is not None:
-                norm_energies = engine.process(raw)
-                try:
-                    screen = skin.render(norm_energies)
-                    sys.stdout.write("\033[H" + "\n".join(screen))
-                    sys.stdout.flush()
-                except Exception as e:
-                    sys.stdout.write("\033[2J\033[H")
-                    sys.stdout.write(f"[!] Error in skin '{skin.name}': {e}\n")
-                    import traceback
-                    tb = ''.join(traceback.format_exc())
-                    sys.stdout.write(tb + "\n")
-                    sys.stdout.flush()
-                    time.sleep(1)  # pause briefly so you can read the error
+            if pending is not None and governor.due():
+                if first_frame:
+                    profile.mark("first audio")
+                draw(skin, pending, renderer, timer, show_timing)
+                pending = None
+                governor.tick()
+                if timer:
+                    now = time.perf_counter()
+                    if last_draw is not None:
+                        timer.add("frame", now - last_draw)
+                    last_draw = now
+                if first_frame:
+                    first_frame = False
+                    profile.mark("first frame")
+                    if args.profile_startup:
+                        break
 
 
     except KeyboardInterrupt:
         pass
     finally:
-        engine.stop()
+        if pipeline:
+            pipeline.stop()
+            pipeline.mailbox.close()
+        if engine:
+            engine.stop()
+        if recorder:
+            recorder.close()
         restore_terminal()
+        atexit.unregister(restore_terminal)  # already restored; don't clear the screen again
+
+    if args.profile_startup:
+        print(profile.report())
+    if args.instrument and timer:
+        timer.dump(args.instrument, skin=skin.name, size=f"{width}x{height}", threaded=args.threaded)
 
 
 
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+bench: headless measurements of bash_blip skins.
+"""
+
+import os
+import re
+import time
+import random
+import argparse
+import numpy as np
+from skins import SKINS
+from core.recording import is_recording, load_recording, resample
+
+_ESCAPE = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+DEFAULT_SIZES = "80x24,160x48,250x70"
+
+
+def silence(num_bands, frames, rng):
+    """Nothing playing: every band at zero."""
+    for _ in range(frames):
+        yield np.zeros(num_bands)
+
+
+def noise(num_bands, frames, rng):
+    """Smoothed random spectra, shaped like AudioEngine.process output."""
+    energies = np.zeros(num_bands)
+    for _ in range(frames):
+        energies = 0.3 * rng.random(num_bands) + 0.7 * energies
+        yield energies.copy()
+
+
+def sweep(num_bands, frames, rng, period=64):
+    """A single tone gliding from the lowest band to the highest and back."""
+    bands = np.arange(num_bands)
+    width = max(1.0, num_bands / 40)
+    for i in range(frames):
+        pos = (i % period) / (period / 2)
+        center = (pos if pos <= 1 else 2 - pos) * (num_bands - 1)
+        yield np.exp(-((bands - center) / width) ** 2)
+
+
+def kick(num_bands, frames, rng, beat=8):
+    """Kick-heavy music: a bass thump every `beat` frames over busy mids and hats."""
+    tilt = np.linspace(0.6, 0.2, num_bands)
+    low = np.arange(num_bands) < max(1, num_bands // 8)
+    high = np.arange(num_bands) >= num_bands * 3 // 4
+    energies = np.zeros(num_bands)
+    for i in range(frames):
+        target = tilt * rng.random(num_bands)
+        target[low] += 0.9 * 0.5 ** (i % beat)
+        if i % (beat // 2) == 0:
+            target[high] += 0.4 * rng.random(high.sum())
+        energies = np.clip(0.5 * target + 0.5 * energies, 0.0, 1.0)
+        yield energies.copy()
+
+
+PROFILES = {
+    "silence": silence,
+    "noise": noise,
+    "sweep": sweep,
+    "kick": kick,
+}
+
+
+def recorded(spectra, num_bands, frames):
+    """Replay stored spectra (frames x bands), resampled to `num_bands` and looped."""
+    spectra = resample(np.atleast_2d(spectra), num_bands)
+    for i in range(frames):
+        yield spectra[i % len(spectra)]
+
+
+def parse_size(text):
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def parse_sizes(text):
+    return [parse_size(size) for size in text.split(",")]
+
+
+def measure(skin, spectra):
+    """Render each spectrum; return per-frame seconds, bytes written, and visible text bytes."""
+    times, sizes, texts = [], [], []
+    for energies in spectra:
+        start = time.perf_counter()
+        frame = "\n".join(skin.render(energies))
+        times.append(time.perf_counter() - start)
+        sizes.append(len(frame.encode()))
+        texts.append(len(_ESCAPE.sub("", frame).encode()))
+    return np.array(times), np.array(sizes), np.array(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bash_blip skins without audio.")
+    parser.add_argument(
+        "--sizes", "--size",
+        type=parse_sizes,
+        default=parse_sizes(DEFAULT_SIZES),
+        help=f"Comma-separated terminal sizes as COLSxROWS (default: {DEFAULT_SIZES})"
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=30,
+        help="Frames rendered per skin, size and profile (default: 30)"
+    )
+    parser.add_argument(
+        "--skins",
+        default=",".join(SKINS),
+        help="Comma-separated skins to run (default: all)"
+    )
+    parser.add_argument(
+        "--profiles",
+        default=",".join(PROFILES),
+        help=f"Comma-separated synthetic inputs from {', '.join(PROFILES)} (default: all)"
+    )
+    parser.add_argument(
+        "--input",
+        default=None,
+        help="Replay a bashblip --record file, or spectra saved with numpy.save (frames x bands), "
+             "instead of the synthetic profiles"
+    )
+    args = parser.parse_args()
+
+    if args.input:
+        stored = load_recording(args.input)[1] if is_recording(args.input) else np.load(args.input)
+        if np.size(stored) == 0:
+            parser.error(f"{args.input} holds no spectra")
+        label = os.path.splitext(os.path.basename(args.input))[0]
+        inputs = {label: lambda num_bands, frames, rng: recorded(stored, num_bands, frames)}
+    else:
+        inputs = {name: PROFILES[name] for name in args.profiles.split(",")}
+
+    print(f"{'skin':16s} {'size':>8s} {'input':>8s} {'p50 ms':>8s} {'p90 ms':>8s} {'p99 ms':>8s} "
+          f"{'bytes/frame':>12s} {'overhead':>9s}")
+    for name in args.skins.split(","):
+        for cols, rows in args.sizes:
+            bar_height = max(4, rows - 2)
+            num_bands = max(8, cols - 2)
+            for label, profile in inputs.items():
+                random.seed(0)
+                skin = SKINS[name](bar_height, num_bands)
+                spectra = profile(num_bands, args.frames, np.random.default_rng(0))
+                times, sizes, texts = measure(skin, spectra)
+                p50, p90, p99 = np.percentile(times, [50, 90, 99]) * 1000
+                print(f"{name:16s} {f'{cols}x{rows}':>8s} {label:>8s} {p50:8.2f} {p90:8.2f} {p99:8.2f} "
+                      f"{int(sizes.mean()):12d} {sizes.sum() / max(1, texts.sum()):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
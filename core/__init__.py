@@ -1,2 +1,4 @@
-from .engine import AudioEngine
-from .monitor import get_default_monitor
\ No newline at end of file
+from .engine import AudioEngine, WINDOWS
+from .monitor import get_default_monitor
+from .pipeline import AnalysisThread, FrameGovernor, Mailbox
+from .sources import AudioSource, ParecSource, PCMFileSource, SyntheticSource
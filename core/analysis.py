@@ -0,0 +1,84 @@
+import numpy as np
+
+PYRAMID_LEVELS = (8, 16, 32)
+
+
+def _sum(values):
+    # left-to-right, so it rounds the same as Python's sum()
+    return values.cumsum()[-1] if values.size else 0.0
+
+
+class Analysis:
+    """Summary statistics of one frame of band energies, computed once.
+
+    `bands` is the full spectrum and `pyramid` maps 8, 16 and 32 to the
+    spectrum averaged down to that many bands. `bass`, `mid` and `high`
+    summarize the lowest quarter, the middle half and the top quarter,
+    each divided by n // 4, n // 2 and n // 4 as the skins always have.
+    `peak`, `floor`, `mean` and `spread` (mean absolute deviation) cover
+    the whole spectrum.
+    """
+
+    def __init__(self, energies):
+        bands = self.bands = np.asarray(energies, dtype=np.float64)
+        n = bands.size
+        # running sums make every band-range average a single subtraction
+        self._cumsum = np.concatenate(([0.0], np.cumsum(bands)))
+
+        # Averages divide left-to-right sums, which round exactly like the
+        # skins' original sum(...) / n; numpy's pairwise sum() differs in
+        # the last bit, enough to flip cells in skins that accumulate them.
+        if n:
+            self.peak = bands.max()
+            self.floor = bands.min()
+            self.mean = self._cumsum[-1] / n
+            self.spread = np.abs(bands - bands.mean()).mean()
+        else:
+            self.peak = self.floor = self.mean = self.spread = 0.0
+
+        quarter = n // 4
+        self.bass = self._cumsum[quarter] / max(1, quarter)
+        self.mid = _sum(bands[quarter:3 * n // 4]) / max(1, n // 2)
+        self.high = _sum(bands[3 * n // 4:]) / max(1, quarter)
+
+        self.pyramid = {count: self.coarse(count) for count in PYRAMID_LEVELS}
+
+    @property
+    def dynamic_range(self):
+        return self.peak - self.floor
+
+    def coarse(self, count):
+        """The spectrum averaged down to `count` equal-width bands.
+
+        With fewer source bands than `count`, bands are repeated instead.
+        """
+        n = self.bands.size
+        if n == 0:
+            return np.zeros(count)
+        if n <= count:
+            return self.bands[np.arange(count) * n // count]
+        edges = np.arange(count + 1) * n // count
+        return (self._cumsum[edges[1:]] - self._cumsum[edges[:-1]]) / np.diff(edges)
+
+
+class Spectrum(np.ndarray):
+    """Band energies as published by AudioEngine, carrying their `analysis`.
+
+    It behaves like the plain array skins always received. Arrays derived
+    from it (slices, arithmetic) have `analysis` set to None, because the
+    statistics describe only the original frame.
+    """
+
+    def __new__(cls, energies):
+        spectrum = np.array(energies, dtype=np.float64).view(cls)
+        spectrum.analysis = Analysis(spectrum.view(np.ndarray))
+        return spectrum
+
+    def __array_finalize__(self, obj):
+        self.analysis = None
+
+
+def analyze(energies):
+    """The Analysis of `energies`: the engine's precomputed one when available."""
+    analysis = getattr(energies, "analysis", None)
+    return analysis if analysis is not None else Analysis(energies)
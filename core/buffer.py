@@ -0,0 +1,85 @@
+import numpy as np
+
+
+class SampleBuffer:
+    """Preallocated s16le capture buffer.
+
+    Bytes are read straight into a fixed int16 array with `readinto`, and
+    frames are handed out as views into it, so steady-state capture does
+    no per-frame allocation. Unread samples are moved back to the front
+    only when the write head runs out of room, which keeps every frame
+    contiguous without a wrap-around copy.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.samples = np.zeros(capacity, dtype=np.int16)
+        self._bytes = self.samples.view(np.uint8)
+        self._view = memoryview(self._bytes)
+        self._read = 0         # first unread sample
+        self._write = 0        # write head, in bytes (may sit mid-sample)
+        self.dropped = 0       # samples discarded without being read
+
+    def __len__(self):
+        return self._write // 2 - self._read
+
+    def _skip(self, count):
+        self._read += count
+        self.dropped += count
+
+    def _compact(self):
+        start = self._read * 2
+        if start == 0:
+            return
+        end = self._write
+        self._bytes[:end - start] = self._bytes[start:end]
+        self._write = end - start
+        self._read = 0
+
+    def fill(self, readinto):
+        """Pull bytes from `readinto` until it would block or reaches EOF.
+
+        Returns False on EOF. When the buffer is full the oldest samples
+        are discarded so capture never stalls behind a slow consumer.
+        """
+        while True:
+            if self._write == len(self._bytes):
+                self._compact()
+                if self._write == len(self._bytes):
+                    self._skip(len(self) // 2)
+                    self._compact()
+            try:
+                n = readinto(self._view[self._write:])
+            except BlockingIOError:
+                return True
+            if n is None:
+                return True
+            if n == 0:
+                return False
+            self._write += n
+
+    def pop(self, size, step=None):
+        """Return a view of the next `size` samples, or None if not yet buffered.
+
+        The read position then advances by `step` (default `size`); a step
+        smaller than the size keeps the tail of this frame for the next
+        one, giving overlapping windows.
+
+        The view is only valid until the next call to `fill`.
+        """
+        if len(self) < size:
+            return None
+        frame = self.samples[self._read:self._read + size]
+        self._read += size if step is None else step
+        return frame
+
+    def latest(self, size, step=None):
+        """Return a view of the newest `size` samples, discarding anything older.
+
+        Returns None until `size` unread samples are buffered. Skipped
+        samples are added to `dropped`.
+        """
+        if len(self) < size:
+            return None
+        self._skip(len(self) - size)
+        return self.pop(size, step)
@@ -0,0 +1,279 @@
+import re
+from itertools import groupby
+import numpy as np
+
+RESET = "\033[0m"
+_SGR = re.compile(r"(\033\[[0-9;]*m)")
+_GAP = 4  # unchanged cells cheaper to rewrite than to jump over with a cursor move
+_transitions = {}
+_switches = {}
+_blank_safe = {}
+
+
+def _sgr_state(codes):
+    # (flags, fg, bg) after applying a run of SGR escape codes
+    fg = bg = None
+    flags = []
+    if not codes:
+        return flags, fg, bg
+    for code in codes[2:-1].split("m\033["):
+        for p in code.split(";"):
+            p = int(p or 0)
+            if p == 0:
+                fg = bg = None
+                flags = []
+            elif 30 <= p <= 37 or 90 <= p <= 97:
+                fg = p
+            elif p == 39:
+                fg = None
+            elif 40 <= p <= 47 or 100 <= p <= 107:
+                bg = p
+            elif p == 49:
+                bg = None
+            elif p not in flags:
+                flags.append(p)
+    return flags, fg, bg
+
+
+def _merge_sgr(attr, token):
+    # fold the codes into one canonical sequence: flags, then fg, then bg
+    flags, fg, bg = _sgr_state(attr + token)
+    params = sorted(flags) + [p for p in (fg, bg) if p is not None]
+    return "\033[" + ";".join(map(str, params)) + "m" if params else ""
+
+
+def _switch_sgr(old, new):
+    # shortest escape sequence taking the terminal from style `old` to `new`
+    if not new:
+        return RESET
+    if not old:
+        return new
+    old_flags, old_fg, old_bg = _sgr_state(old)
+    new_flags, new_fg, new_bg = _sgr_state(new)
+    if (set(old_flags) <= set(new_flags)
+            and (old_fg is None or new_fg is not None)
+            and (old_bg is None or new_bg is not None)):
+        return new
+    return RESET + new
+
+
+def switch_sgr(old, new):
+    """Escape codes that change the current style from `old` to `new`."""
+    key = (old, new)
+    codes = _switches.get(key)
+    if codes is None:
+        codes = _switches[key] = _switch_sgr(old, new)
+    return codes
+
+
+def apply_sgr(attr, token):
+    """Style in effect after SGR `token` is applied on top of `attr`."""
+    key = (attr, token)
+    merged = _transitions.get(key)
+    if merged is None:
+        merged = _transitions[key] = _merge_sgr(attr, token)
+    return merged
+
+
+def parse_cells(line):
+    """Split a rendered line into `(attr, char)` cells.
+
+    `attr` is a canonical SGR sequence for the style the character is
+    drawn in ('' for the default style), so equal styles compare equal
+    however the skin happened to spell them.
+    """
+    cells = []
+    attr = ""
+    for i, token in enumerate(_SGR.split(line)):
+        if i % 2:
+            attr = apply_sgr(attr, token)
+        elif token:
+            cells.extend([(attr, ch) for ch in token])
+    return cells
+
+
+def _keeps_blanks(attr):
+    # a space looks the same in this style as in the default one
+    flags, _, bg = _sgr_state(attr)
+    return not flags and bg is None
+
+
+def _blank_key(cell):
+    # spaces in a foreground-only color can join whatever run surrounds them
+    color, ch = cell
+    if ch == " " and color:
+        keeps = _blank_safe.get(color)
+        if keeps is None:
+            keeps = _blank_safe[color] = _keeps_blanks(color)
+        if keeps:
+            return None
+    return color
+
+
+def join_cells(cells):
+    """Serialize a row of `(color, char)` cells into one terminal line.
+
+    `color` is the escape sequence the cell is drawn in ('' or None for
+    the default style). Adjacent cells in the same color share a single
+    escape sequence, spaces don't interrupt a foreground-only color run,
+    and one reset closes the line.
+    """
+    out = []
+    current = ""
+    for color, run in groupby(cells, key=_blank_key):
+        chars = "".join([ch for _, ch in run])
+        if not color:
+            if current:
+                keeps = _blank_safe.get(current)
+                if keeps is None:
+                    keeps = _blank_safe[current] = _keeps_blanks(current)
+                if keeps and not chars.strip(" "):
+                    out.append(chars)
+                    continue
+                out.append(RESET)
+                current = ""
+        elif color != current:
+            out.append(switch_sgr(current, color))
+            current = color
+        out.append(chars)
+    if current:
+        out.append(RESET)
+    return "".join(out)
+
+
+def join_grid(chars, colors=None, palette=()):
+    """Serialize a whole frame given as arrays, like `join_cells` per row.
+
+    `chars` is an (h, w) array of single characters and `colors` an
+    array of indices into `palette` (-1 for the default style) that
+    broadcasts to the same shape.
+    Color runs are found with array operations, so the Python work per
+    row is one join plus one step per run.
+    """
+    text = ["".join(row) for row in chars.tolist()]
+    if colors is None:
+        return text
+
+    codes = list(palette) + [""]
+    blank_ok = np.array([_keeps_blanks(code) for code in palette] + [True])
+    colors = np.broadcast_to(np.where(colors < 0, len(palette), colors), chars.shape)
+
+    # spaces take on the color of the run they sit in, as in join_cells
+    own = (chars != " ") | ~blank_ok[colors]
+    w = colors.shape[1]
+    source = np.where(own, np.arange(w), -1)
+    np.maximum.accumulate(source, axis=1, out=source)
+    rows = np.arange(colors.shape[0])[:, np.newaxis]
+    filled = np.where(source >= 0, colors[rows, np.maximum(source, 0)], len(palette))
+    # ...but only when that run's style leaves blanks looking blank
+    filled = np.where(own | blank_ok[filled], filled, colors)
+
+    lines = []
+    breaks = filled[:, 1:] != filled[:, :-1]
+    for y, line in enumerate(text):
+        out = []
+        current = ""
+        start = 0
+        for end in list(np.flatnonzero(breaks[y]) + 1) + [w]:
+            code = codes[filled[y, start]]
+            if code != current:
+                out.append(switch_sgr(current, code))
+                current = code
+            out.append(line[start:end])
+            start = end
+        if current:
+            out.append(RESET)
+        lines.append("".join(out))
+    return lines
+
+
+class FullRenderer:
+    """Rewrites the whole screen every frame."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def reset(self):
+        pass
+
+    def draw(self, screen):
+        self.stream.write("\033[H" + "\n".join(screen))
+        self.stream.flush()
+
+
+class DiffRenderer:
+    """Writes only the cells that changed since the previous frame.
+
+    The previous frame is kept as a grid of cells; each frame emits a
+    cursor move plus the changed run for every region that differs.
+    Call `reset` whenever something else draws on the terminal so the
+    next frame is written in full.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.reset()
+
+    def reset(self):
+        self._lines = None
+        self._cells = []
+
+    def draw(self, screen):
+        if self._lines is None:
+            self.stream.write("\033[H" + "\n".join(screen))
+            self.stream.flush()
+            self._lines = list(screen)
+            self._cells = [None] * len(screen)
+            return
+
+        out = []
+        attr = ""
+        for y, line in enumerate(screen):
+            if y < len(self._lines):
+                if line == self._lines[y]:
+                    continue
+                prev = self._cells[y]
+                if prev is None:
+                    prev = parse_cells(self._lines[y])
+            else:
+                self._lines.append("")
+                self._cells.append(None)
+                prev = []
+            cells = parse_cells(line)
+            # cells past the end of a shorter line stay on screen untouched
+            cells.extend(prev[len(cells):])
+            attr = self._diff_row(out, y, prev, cells, attr)
+            self._lines[y] = line
+            self._cells[y] = cells
+
+        if attr:
+            out.append(RESET)
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+
+    def _diff_row(self, out, y, prev, cells, attr):
+        n = len(cells)
+        x = 0
+        while x < n:
+            if x < len(prev) and cells[x] == prev[x]:
+                x += 1
+                continue
+            # extend the run through short unchanged gaps
+            end = x + 1
+            gap = 0
+            while end < n and gap <= _GAP:
+                if end < len(prev) and cells[end] == prev[end]:
+                    gap += 1
+                else:
+                    gap = 0
+                end += 1
+            end -= gap
+            out.append(f"\033[{y + 1};{x + 1}H")
+            for cell_attr, ch in cells[x:end]:
+                if cell_attr != attr:
+                    out.append(switch_sgr(attr, cell_attr))
+                    attr = cell_attr
+                out.append(ch)
+            x = end
+        return attr
@@ -1,7 +1,25 @@
-import subprocess
+import time
 import numpy as np
-import os
-import fcntl
+from functools import lru_cache
+from .analysis import Spectrum
+from .buffer import SampleBuffer
+from .sources import ParecSource
+
+WINDOWS = {
+    "rect": np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+
+@lru_cache(maxsize=None)
+def window_function(name, size):
+    """Cached analysis window of the given kind and length."""
+    window = WINDOWS[name](size).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
 
 class AudioEngine:
     def __init__(
@@ -10,18 +28,44 @@ class AudioEngine:
         rate=22050,
         balance_gain_factor=2500.0,   # ← added
         split_freq=300.0,              # ← added
-        headroom_factor=1.5            # ← added
+        headroom_factor=1.5,           # ← added
+        latest_only=False,
+        window_size=None,
+        hop_size=None,
+        window="rect"
     ):
         self.rate = rate
         self.num_bands = num_bands
         self.balance_gain_factor = balance_gain_factor  # ← store
         self.split_freq = split_freq                    # ← store
         self.headroom_factor = headroom_factor          # ← store
-        self.chunk = min(2048, max(256, num_bands * 4))
+        self.latest_only = latest_only  # analyze only the newest chunk, drop the rest
+        self.last_dropped = 0
+        self.eof = False
+        self.timer = None  # a core.timing.StageTimer to time fft/bands
+        # FFT size (resolution) and hop (update rate) are independent;
+        # by default both follow the terminal width and windows don't overlap.
+        self.chunk = self.default_window_size(num_bands) if window_size is None else window_size
+        if self.chunk <= 0:
+            raise ValueError(f"window size must be a positive number of samples, got {self.chunk}")
+        self.hop = self.chunk if hop_size is None else hop_size
+        if self.hop <= 0:
+            raise ValueError(f"hop must be a positive number of samples, got {self.hop}")
+        if self.hop > self.chunk:
+            # the read position would overtake the capture buffer's write head
+            raise ValueError(f"hop of {self.hop} samples is larger than the {self.chunk}-sample window")
+        self.window = window_function(window, self.chunk)
         self.bands, self.freqs = self._create_hybrid_bands(split_freq)
+        self._compile_band_reducer()
         self.balance_gain = self._compute_balance_gain(balance_gain_factor)
         self.band_peaks = np.ones(num_bands) * 1000.0
         self.smoothed = np.zeros(num_bands)
+        self._samples = np.zeros(self.chunk, dtype=np.float32)
+
+    @staticmethod
+    def default_window_size(num_bands):
+        """FFT size used when none is given: about four samples per band."""
+        return min(2048, max(256, num_bands * 4))
 
     def _create_hybrid_bands(self, split_freq=300.0):
         freqs = np.fft.rfftfreq(self.chunk, 1.0 / self.rate)
@@ -51,57 +95,83 @@ class AudioEngine:
             bands.append(indices)
         return bands, freqs
 
+    def _compile_band_reducer(self):
+        # Every band is a contiguous run of FFT bins, so the per-band mean
+        # reduces to two lookups into a cumulative sum.
+        self.band_starts = np.array([band[0] for band in self.bands], dtype=np.intp)
+        self.band_stops = np.array([band[-1] + 1 for band in self.bands], dtype=np.intp)
+        self.band_counts = (self.band_stops - self.band_starts).astype(np.float64)
+        self._cumsum = np.zeros(len(self.freqs) + 1)
+
+    def _reduce_bands(self, values):
+        """Mean of `values` over each band, in one vectorized pass."""
+        np.cumsum(values, out=self._cumsum[1:])
+        sums = self._cumsum[self.band_stops] - self._cumsum[self.band_starts]
+        return sums / self.band_counts
+
     def _compute_balance_gain(self, gain_factor):
-        freq_centers = np.array([
-            np.mean(self.freqs[band]) if len(self.freqs[band]) > 1 else self.freqs[band[0]]
-            for band in self.bands
-        ])
-        return np.clip(gain_factor / np.sqrt(freq_centers), 1.0, 12.0)
-
-    def start_stream(self, device):
-        env = os.environ.copy()
-        env["PULSE_LATENCY_MSEC"] = "10"
-        self.proc = subprocess.Popen(
-            [
-                "parec",
-                f"--rate={self.rate}",
-                "--channels=1",
-                "--format=s16le",
-                f"--device={device}",
-                "--latency-msec=10",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            env=env,
-        )
-        fd = self.proc.stdout.fileno()
-        fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-        self.buffer = bytearray()
+        freq_centers = self._reduce_bands(self.freqs)
+        with np.errstate(divide="ignore"):
+            return np.clip(gain_factor / np.sqrt(freq_centers), 1.0, 12.0)
+
+    def start_stream(self, source):
+        """Start reading audio from `source`.
+
+        `source` is an AudioSource, or a PulseAudio device name to
+        capture from with parec.
+        """
+        if isinstance(source, str):
+            source = ParecSource(source)
+        self.source = source
+        source.open(self.rate)
+        self.buffer = SampleBuffer(max(8 * self.chunk, self.rate // 2))
+
+    def fileno(self):
+        """File descriptor of the audio stream, for select()."""
+        return self.source.fileno()
+
+    @property
+    def dropped_samples(self):
+        """Total samples captured but never analyzed."""
+        return self.buffer.dropped
 
     def read_frame(self):
-        try:
-            while True:
-                chunk = self.proc.stdout.read(4096)
-                if chunk:
-                    self.buffer.extend(chunk)
-                else:
-                    break
-        except (OSError, TypeError):
-            pass
+        """Return the next `chunk` samples as an int16 view, or None.
 
-        frame_bytes = self.chunk * 2
-        if len(self.buffer) < frame_bytes:
-            return None
+        Successive frames start `hop` samples apart, so with a hop smaller
+        than the chunk they overlap and frames arrive every `hop` samples.
 
-        raw = self.buffer[:frame_bytes]
-        del self.buffer[:frame_bytes]
+        With `latest_only` set, the most recent `chunk` samples are returned
+        instead and everything older is discarded, so latency stays bounded
+        by one chunk however slowly frames are consumed; `last_dropped`
+        holds how many samples that skipped.
+
+        The view points into the capture buffer and is only valid until
+        the next call to read_frame.
+        """
+        before = self.buffer.dropped
+        try:
+            self.eof = not self.buffer.fill(self.source.readinto)
+        except OSError:
+            pass
+        if self.latest_only:
+            raw = self.buffer.latest(self.chunk, self.hop)
+        else:
+            raw = self.buffer.pop(self.chunk, self.hop)
+        self.last_dropped = self.buffer.dropped - before
         return raw
 
     def process(self, raw_frame):
-        samples = np.frombuffer(raw_frame, dtype=np.int16).astype(np.float32)
-        fft = np.abs(np.fft.rfft(samples))
-        energies = np.array([np.mean(fft[band]) for band in self.bands])
+        timer = self.timer
+        if timer:
+            start = time.perf_counter()
+        np.copyto(self._samples, np.frombuffer(raw_frame, dtype=np.int16))
+        self._samples *= self.window
+        fft = np.abs(np.fft.rfft(self._samples))
+        if timer:
+            transformed = time.perf_counter()
+            timer.add("fft", transformed - start)
+        energies = self._reduce_bands(fft)
         balanced = energies * self.balance_gain
         self.band_peaks = np.maximum(balanced, self.band_peaks * 0.995)
         norm = np.clip(
@@ -109,8 +179,10 @@ class AudioEngine:
                 0.0, 1.0
             )
         self.smoothed = 0.3 * norm + 0.7 * self.smoothed
-        return self.smoothed.copy()
+        spectrum = Spectrum(self.smoothed)
+        if timer:
+            timer.add("bands", time.perf_counter() - transformed)
+        return spectrum
 
     def stop(self):
-        self.proc.terminate()
-        self.proc.wait()
\ No newline at end of file
+        self.source.close()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import io
+import json
+import struct
+import sys
+import time
+import numpy as np
+from .display import DiffRenderer
+
+DEFAULT_RATE = 22050
+
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# (format, bytes per sample) pairs load_audio can decode
+_WAV_DECODABLE = {(WAVE_FORMAT_PCM, 1), (WAVE_FORMAT_PCM, 2), (WAVE_FORMAT_PCM, 3), (WAVE_FORMAT_PCM, 4),
+                  (WAVE_FORMAT_IEEE_FLOAT, 4), (WAVE_FORMAT_IEEE_FLOAT, 8)}
+
+
+def load_audio(path, rate=DEFAULT_RATE):
+    """Read a WAV or raw s16le file as mono int16 samples.
+
+    Returns `(samples, rate)`. WAV files bring their own rate and are
+    mixed down to mono; raw files are taken to be mono at `rate`. `path`
+    may be '-' for raw PCM on stdin. Raises ValueError for a WAV file in
+    an encoding that can't be decoded.
+    """
+    if path == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return np.frombuffer(data[:len(data) // 2 * 2], dtype="<i2"), rate
+    return _decode_wav(data)
+
+
+def _wav_chunks(data):
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id, size = struct.unpack_from("<4sI", data, pos)
+        yield chunk_id, data[pos + 8:pos + 8 + size]
+        pos += 8 + size + (size & 1)  # chunks are padded to an even length
+
+
+def _decode_wav(data):
+    fmt = payload = None
+    for chunk_id, body in _wav_chunks(data):
+        if chunk_id == b"fmt ":
+            fmt = body
+        elif chunk_id == b"data":
+            payload = body
+            break
+    if fmt is None or len(fmt) < 16 or payload is None:
+        raise ValueError("WAV file has no fmt or data chunk")
+
+    tag, channels, rate, _, block_align, bits = struct.unpack_from("<HHIIHH", fmt)
+    if tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        tag = struct.unpack_from("<H", fmt, 24)[0]  # first field of the subformat GUID
+    if channels == 0:
+        raise ValueError("WAV file has no channels")
+
+    width = block_align // channels  # container size; e.g. 12-bit samples sit in 2 bytes
+    if (tag, width) not in _WAV_DECODABLE:
+        raise ValueError(f"unsupported WAV encoding: format {tag:#x}, {bits}-bit samples")
+    payload = payload[:len(payload) // width * width]
+    if tag == WAVE_FORMAT_PCM and width == 1:
+        samples = (np.frombuffer(payload, dtype=np.uint8).astype(np.int32) - 128) << 8
+    elif tag == WAVE_FORMAT_PCM and width == 2:
+        samples = np.frombuffer(payload, dtype="<i2").astype(np.int32)
+    elif tag == WAVE_FORMAT_PCM and width == 3:
+        # the top two bytes of each little-endian sample are its 16-bit value
+        samples = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3)[:, 1:].copy().view("<i2")[:, 0]
+        samples = samples.astype(np.int32)
+    elif tag == WAVE_FORMAT_PCM and width == 4:
+        samples = np.frombuffer(payload, dtype="<i4") >> 16
+    else:
+        samples = np.frombuffer(payload, dtype=f"<f{width}")
+        samples = np.clip(np.nan_to_num(samples), -1.0, 1.0) * 32767
+    samples = samples[:len(samples) // channels * channels].reshape(-1, channels)
+    return samples.mean(axis=1).astype(np.int16), rate
+
+
+def frames(samples, chunk, hop):
+    """Successive `chunk`-sample windows of `samples`, `hop` samples apart."""
+    if len(samples) < chunk:
+        return np.empty((0, chunk), dtype=samples.dtype)
+    return np.lib.stride_tricks.sliding_window_view(samples, chunk)[::hop]
+
+
+class AnsiWriter:
+    """Writes frames as one terminal stream; `cat` the file to replay it."""
+
+    def __init__(self, stream, cols, rows):
+        self.stream = stream
+        self.renderer = DiffRenderer(stream)
+        stream.write("\033[2J")
+
+    def write(self, screen, seconds):
+        self.renderer.draw(screen)
+
+
+class CastWriter:
+    """Writes frames as an asciicast v2 recording with their audio timestamps."""
+
+    def __init__(self, stream, cols, rows):
+        self.stream = stream
+        self.buffer = io.StringIO()
+        self.renderer = DiffRenderer(self.buffer)
+        header = {"version": 2, "width": cols, "height": rows, "env": {"TERM": "xterm-256color"}}
+        stream.write(json.dumps(header) + "\n")
+        stream.write(json.dumps([0.0, "o", "\033[2J"]) + "\n")
+
+    def write(self, screen, seconds):
+        self.renderer.draw(screen)
+        out = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        # players replay output verbatim; a live pty would have turned LF into CRLF
+        out = out.replace("\n", "\r\n")
+        self.stream.write(json.dumps([round(seconds, 6), "o", out]) + "\n")
+
+
+def render_offline(engine, samples, skin, out, cols, rows, recorder=None):
+    """Analyze every hop of `samples` and render each frame to `out` as fast as possible.
+
+    Files ending in `.cast` are written as asciicast, anything else as a
+    raw ANSI stream. Each spectrum also goes to `recorder` if given.
+    Returns `(frames rendered, seconds taken)`.
+    """
+    writer_cls = CastWriter if out.endswith(".cast") else AnsiWriter
+    count = 0
+    start = time.perf_counter()
+    with open(out, "w", encoding="utf-8") as stream:
+        writer = writer_cls(stream, cols, rows)
+        for raw in frames(samples, engine.chunk, engine.hop):
+            energies = engine.process(raw)
+            seconds = (count * engine.hop + engine.chunk) / engine.rate
+            if recorder:
+                recorder.write(energies, seconds)
+            writer.write(skin.render(energies), seconds)
+            count += 1
+    return count, time.perf_counter() - start
@@ -0,0 +1,103 @@
+import os
+import select
+import threading
+import time
+
+
+class Mailbox:
+    """Single-slot, latest-value-wins handoff between one writer and readers.
+
+    The slot holds a `(sequence, value)` tuple that is replaced wholesale,
+    so a reader never sees a torn update and no lock is needed. Every
+    `put` also writes a byte to a pipe, so a reader can wait on
+    `fileno()` with select() instead of polling.
+    """
+
+    def __init__(self):
+        self._slot = (0, None)
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+    def put(self, value):
+        self._slot = (self._slot[0] + 1, value)
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # the pipe is full of wakeups the reader hasn't drained yet
+
+    def get(self):
+        # drain before reading the slot: a put landing in between leaves a
+        # byte behind, so the next wait returns at once rather than missing it
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return self._slot
+
+    def fileno(self):
+        """Readable whenever a value was put since the last `get`."""
+        return self._wake_r
+
+    def close(self):
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+
+class AnalysisThread(threading.Thread):
+    """Owns the engine's capture stream and FFT, publishing to a Mailbox.
+
+    Audio is read and analyzed as soon as it arrives, independent of how
+    long the consumer takes to render each frame. With a `recorder`,
+    every analyzed frame is also written to it.
+    """
+
+    def __init__(self, engine, mailbox=None, recorder=None):
+        super().__init__(name="bashblip-analysis", daemon=True)
+        self.engine = engine
+        self.mailbox = mailbox or Mailbox()
+        self.recorder = recorder
+        self._stopped = threading.Event()
+
+    def run(self):
+        fd = self.engine.fileno()
+        while not self._stopped.is_set() and not self.engine.eof:
+            start = time.perf_counter()
+            raw = self.engine.read_frame()
+            if raw is None:
+                select.select([fd], [], [], 0.05)
+                continue
+            if self.engine.timer:
+                self.engine.timer.add("read", time.perf_counter() - start)
+            energies = self.engine.process(raw)
+            if self.recorder:
+                self.recorder.write(energies)
+            self.mailbox.put(energies)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+class FrameGovernor:
+    """Paces rendering to a target frame rate without busy-waiting.
+
+    With `fps` of 0 every frame is due immediately. A frame that runs
+    late pushes the schedule back instead of bursting to catch up.
+    """
+
+    def __init__(self, fps):
+        self.interval = 1.0 / fps if fps else 0.0
+        self.next_frame = time.monotonic()
+
+    def timeout(self):
+        """Seconds until the next frame is due (0 if it already is)."""
+        return max(0.0, self.next_frame - time.monotonic())
+
+    def due(self):
+        return time.monotonic() >= self.next_frame
+
+    def tick(self):
+        """Mark a frame as rendered and schedule the next one."""
+        self.next_frame = max(self.next_frame + self.interval, time.monotonic())
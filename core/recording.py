@@ -0,0 +1,111 @@
+import struct
+import threading
+import time
+import numpy as np
+from .pipeline import Mailbox
+
+# File layout: a header (magic, version, value type, band count) followed
+# by fixed-size records of a uint32 millisecond timestamp and one value
+# per band, all little-endian.
+MAGIC = b"BBLIPREC"
+VERSION = 1
+_HEADER = struct.Struct("<8sBBH")
+_TYPES = {1: "uint8", 2: "float16"}
+
+
+def _record_dtype(value_type, num_bands):
+    return np.dtype([("ms", "<u4"), ("energies", np.dtype(value_type).newbyteorder("<"), (num_bands,))])
+
+
+def is_recording(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class EnergyRecorder:
+    """Appends normalized energy vectors to a compact recording file.
+
+    `value_type` is "uint8" (0-255 steps, one byte per band) or "float16".
+    Timestamps are taken when each vector is written unless given.
+    """
+
+    def __init__(self, path, num_bands, value_type="uint8"):
+        codes = {name: code for code, name in _TYPES.items()}
+        if value_type not in codes:
+            raise ValueError(f"unsupported value type {value_type!r}")
+        self.num_bands = num_bands
+        self.value_type = value_type
+        self._dtype = _record_dtype(value_type, num_bands)
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, codes[value_type], num_bands))
+        self.start = time.monotonic()
+
+    def write(self, energies, seconds=None):
+        if seconds is None:
+            seconds = time.monotonic() - self.start
+        record = np.zeros(1, dtype=self._dtype)
+        record["ms"] = int(seconds * 1000)
+        if self.value_type == "uint8":
+            record["energies"] = np.rint(np.clip(energies, 0.0, 1.0) * 255)
+        else:
+            record["energies"] = energies
+        self._file.write(record.tobytes())
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_recording(path):
+    """Read a recording as `(seconds, energies)`: a (frames,) and a (frames, bands) float array."""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an energy recording")
+        magic, version, code, num_bands = _HEADER.unpack(header)
+        if version != VERSION or code not in _TYPES:
+            raise ValueError(f"{path}: unsupported recording version {version}")
+        records = np.fromfile(f, dtype=_record_dtype(_TYPES[code], num_bands))
+    energies = records["energies"].astype(np.float64)
+    if code == 1:
+        energies /= 255.0
+    return records["ms"] / 1000.0, energies
+
+
+def resample(energies, num_bands):
+    """Stretch or squeeze band vectors (last axis) to `num_bands` bands."""
+    energies = np.asarray(energies, dtype=np.float64)
+    if energies.shape[-1] == num_bands:
+        return energies
+    if energies.size == 0:
+        return np.zeros(energies.shape[:-1] + (num_bands,))
+    src = np.linspace(0.0, 1.0, energies.shape[-1])
+    dst = np.linspace(0.0, 1.0, num_bands)
+    return np.apply_along_axis(lambda e: np.interp(dst, src, e), -1, energies)
+
+
+class ReplayThread(threading.Thread):
+    """Publishes a recording to a Mailbox at its original pace, like AnalysisThread."""
+
+    def __init__(self, path, num_bands, mailbox=None):
+        super().__init__(name="bashblip-replay", daemon=True)
+        self.times, energies = load_recording(path)
+        self.energies = resample(energies, num_bands)
+        self.mailbox = mailbox or Mailbox()
+        self._stopped = threading.Event()
+
+    def run(self):
+        start = time.monotonic()
+        for seconds, energies in zip(self.times, self.energies):
+            if self._stopped.wait(max(0.0, start + seconds - time.monotonic())):
+                return
+            self.mailbox.put(energies.copy())
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
@@ -0,0 +1,209 @@
+import os
+import stat
+import subprocess
+import threading
+import time
+import numpy as np
+from .monitor import get_default_monitor
+
+
+class AudioSource:
+    """Somewhere AudioEngine can read mono s16le PCM at its sample rate.
+
+    `open(rate)` starts the stream and `fileno()` is a non-blocking
+    descriptor to select() on. `readinto(buf)` acts like a raw
+    non-blocking read: the byte count, None when nothing is ready yet, or
+    0 at the end of the stream. `close()` releases everything.
+    """
+
+    _fd = None
+
+    def open(self, rate):
+        raise NotImplementedError
+
+    def fileno(self):
+        return self._fd
+
+    def readinto(self, buf):
+        try:
+            return os.readv(self._fd, [buf])
+        except BlockingIOError:
+            return None
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class ParecSource(AudioSource):
+    """Capture from PulseAudio with `parec`; `device` defaults to the default sink's monitor."""
+
+    def __init__(self, device=None):
+        self.device = device
+        self.proc = None
+
+    def open(self, rate):
+        if self.device is None:
+            self.device = get_default_monitor()
+        env = os.environ.copy()
+        env["PULSE_LATENCY_MSEC"] = "10"
+        self.proc = subprocess.Popen(
+            [
+                "parec",
+                f"--rate={rate}",
+                "--channels=1",
+                "--format=s16le",
+                f"--device={self.device}",
+                "--latency-msec=10",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            bufsize=0,
+        )
+        self._fd = self.proc.stdout.fileno()
+        os.set_blocking(self._fd, False)
+
+    def readinto(self, buf):
+        return self.proc.stdout.readinto(buf)
+
+    def close(self):
+        if self.proc is not None:
+            self.proc.terminate()
+            self.proc.wait()
+            self.proc.stdout.close()
+            self.proc = None
+            self._fd = None
+
+
+class PacedSource(AudioSource):
+    """Base for sources that have all their audio at hand and must play it in real time.
+
+    A feeder thread writes `next_block` into a pipe at `rate` samples a
+    second, so the read end behaves like a live capture. Subclasses
+    return the next samples as int16 from `next_block(count)`, or an
+    empty array when they are done.
+    """
+
+    block = 256  # samples per write
+
+    def open(self, rate):
+        self.rate = rate
+        self._fd, self._write_fd = os.pipe()
+        os.set_blocking(self._fd, False)
+        self._stopped = threading.Event()
+        self._feeder = threading.Thread(target=self._feed, name="bashblip-source", daemon=True)
+        self._feeder.start()
+
+    def next_block(self, count):
+        raise NotImplementedError
+
+    def _feed(self):
+        start = time.monotonic()
+        written = 0
+        try:
+            while not self._stopped.is_set():
+                samples = self.next_block(self.block)
+                if len(samples) == 0:
+                    break
+                os.write(self._write_fd, samples.astype("<i2").tobytes())
+                written += len(samples)
+                delay = start + written / self.rate - time.monotonic()
+                if delay > 0:
+                    self._stopped.wait(delay)
+        except OSError:  # reader closed the pipe
+            pass
+        finally:
+            os.close(self._write_fd)
+
+    def close(self):
+        if self._fd is not None:
+            self._stopped.set()
+            super().close()  # a writer blocked on the pipe gets EPIPE
+            self._feeder.join()
+
+
+class PCMFileSource(PacedSource):
+    """Raw mono s16le PCM at the engine rate from a file, FIFO, or '-' for stdin.
+
+    Pipes and FIFOs are read as they fill, paced by whoever writes them.
+    Regular files are played back in real time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._stream = None
+
+    def open(self, rate):
+        if self.path == "-":
+            fd = os.dup(0)
+        else:
+            fd = os.open(self.path, os.O_RDONLY)  # a FIFO waits here for its writer
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            self._stream = os.fdopen(fd, "rb")
+            super().open(rate)
+        else:
+            os.set_blocking(fd, False)
+            self._fd = fd
+
+    def next_block(self, count):
+        data = self._stream.read(count * 2)
+        return np.frombuffer(data[:len(data) // 2 * 2], dtype="<i2")
+
+    def close(self):
+        if self._stream is None:
+            AudioSource.close(self)
+            return
+        super().close()
+        self._stream.close()
+        self._stream = None
+
+
+class SyntheticSource(PacedSource):
+    """Generated test audio, so the engine can run without any sound system.
+
+    `generate` is deterministic for a given signal, rate and seed, so it
+    can also be called directly for offline tests.
+    """
+
+    SIGNALS = ("silence", "sine", "sweep", "noise", "kick")
+
+    def __init__(self, signal="sweep", seed=0, rate=None):
+        if signal not in self.SIGNALS:
+            raise ValueError(f"unknown signal {signal!r}")
+        self.signal = signal
+        self.rate = rate
+        self.position = 0
+        self.rng = np.random.default_rng(seed)
+
+    def open(self, rate):
+        self.rate = rate
+        super().open(rate)
+
+    def next_block(self, count):
+        return self.generate(count)
+
+    def generate(self, count):
+        """Next `count` samples as int16, continuing from the previous call."""
+        t = (self.position + np.arange(count)) / self.rate
+        self.position += count
+        if self.signal == "silence":
+            wave = np.zeros(count)
+        elif self.signal == "sine":
+            wave = 0.5 * np.sin(2 * np.pi * 440.0 * t)
+        elif self.signal == "sweep":
+            # exponential 50 Hz -> 8 kHz glide, restarting every 8 seconds
+            period, f0, ratio = 8.0, 50.0, 160.0
+            k = np.log(ratio) / period
+            wave = 0.5 * np.sin(2 * np.pi * f0 * (np.exp(k * (t % period)) - 1) / k)
+        elif self.signal == "noise":
+            wave = 0.2 * self.rng.standard_normal(count)
+        else:
+            # 120 bpm: a kick every beat, hats on the off-beats, a bass line underneath
+            beat = t % 0.5
+            offbeat = t % 0.25
+            wave = (0.8 * np.sin(2 * np.pi * 55.0 * beat) * np.exp(-beat * 12.0)
+                    + 0.15 * self.rng.standard_normal(count) * np.exp(-offbeat * 60.0)
+                    + 0.1 * np.sin(2 * np.pi * 110.0 * t))
+        return (np.clip(wave, -1.0, 1.0) * 32767).astype(np.int16)
@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from .display import join_cells, parse_cells
+
+OVERLAY_STYLE = "\033[7m"  # reverse video
+
+
+class StartupProfile:
+    """Wall-clock time spent in each named phase of startup.
+
+    Each call to `mark` closes the phase that began at the previous mark
+    (or at `start`), so phases tile the timeline with no gaps.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.start
+
+    def report(self):
+        """Table of phases in milliseconds, one per line."""
+        width = max([len(phase) for phase, _ in self.phases] + [len("total")])
+        lines = ["startup profile:"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<{width}}  {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'total':<{width}}  {self.total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class StageTimer:
+    """Rolling durations of the named stages of the frame loop.
+
+    The last `window` samples of each stage are kept, so percentiles
+    follow what is on screen now rather than the whole session. `add` may
+    be called from the analysis thread while the main thread reads.
+    """
+
+    def __init__(self, window=240):
+        self.window = window
+        self.samples = {}
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage, seconds):
+        with self._lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.window)
+                self.counts[stage] = 0
+            self.samples[stage].append(seconds)
+            self.counts[stage] += 1
+
+    def stats(self):
+        """Per-stage count and rolling p50/p99/mean/max in milliseconds."""
+        with self._lock:
+            samples = {stage: np.array(values) * 1000 for stage, values in self.samples.items()}
+            counts = dict(self.counts)
+        stats = {}
+        for stage, ms in samples.items():
+            p50, p99 = np.percentile(ms, [50, 99])
+            stats[stage] = {
+                "count": counts[stage],
+                "p50_ms": round(float(p50), 3),
+                "p99_ms": round(float(p99), 3),
+                "mean_ms": round(float(ms.mean()), 3),
+                "max_ms": round(float(ms.max()), 3),
+            }
+        return stats
+
+    def overlay(self, screen):
+        """`screen` with a p50/p99 table drawn over its top-left corner."""
+        stats = self.stats()
+        table = [f" {'stage':<8}{'p50 ms':>9}{'p99 ms':>9} "]
+        for stage, s in stats.items():
+            table.append(f" {stage:<8}{s['p50_ms']:9.2f}{s['p99_ms']:9.2f} ")
+        if "frame" in stats and stats["frame"]["p50_ms"] > 0:
+            table.append(f" {'fps':<8}{1000 / stats['frame']['p50_ms']:9.1f}{'':9} ")
+
+        screen = list(screen)
+        for y, text in enumerate(table[:len(screen)]):
+            cells = parse_cells(screen[y])
+            screen[y] = join_cells([(OVERLAY_STYLE, ch) for ch in text] + cells[len(text):])
+        return screen
+
+    def dump(self, path, **info):
+        """Write the current stats, plus any `info`, to `path` as JSON."""
+        with open(path, "w") as f:
+            json.dump(dict(info, stages=self.stats()), f, indent=2)
+            f.write("\n")
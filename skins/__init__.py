@@ -1,70 +1,75 @@
+import importlib
+from collections.abc import Mapping
+
 from .base import BaseSkin
-from .blocks import BlocksSkin
-from .gradient import GradientSkin
-from .sparkline import SparklineSkin
-from .fire import FireSkin
-from .spiral import SpiralSkin
-from .tunnel import TunnelSkin
-from .aurora import AuroraSkin
-from .diamondwave import DiamondWaveSkin
-from .hexgrid import HexGridSkin
-from .sunburst import SunburstSkin
-from .quantumwave import QuantumWaveSkin
-from .vortex import VortexSkin
-from .hypercube import HypercubeSkin
-from .mandelbrot import MandelbrotSkin
-from .fractaltree import FractalTreeSkin
-from .plasmastorm import PlasmaStormSkin
-from .prism import PrismSkin
-from .hexwarp import HexWarpSkin
-from .auroraflow import AuroraFlowSkin
-from .vortexmotion import VortexMotionSkin
-from .depthgrid import DepthGridSkin
-from .warptunnel import WarpTunnelSkin
-from .pulsematrix import PulseMatrixSkin
-from .fractalbloom import FractalBloomSkin
-from .neuronet import NeuroNetSkin
-from .fractallattice import FractalLatticeSkin
-from .moirefield import MoireFieldSkin
-from .waveformcanvas import WaveformCanvasSkin
-from .spectrumrain import SpectrumRainSkin
-from .harmonicflow import HarmonicFlowSkin
-from .resonancesphere import ResonanceSphereSkin
-from .harmonicfield import HarmonicFieldSkin
-from .cymatic import CymaticSkin
 
-SKINS = {
-    "blocks": BlocksSkin,
-    "gradient": GradientSkin,
-    "sparkline": SparklineSkin,
-    "fire": FireSkin,
-    "spiral": SpiralSkin,
-    "tunnel": TunnelSkin,
-    "aurora": AuroraSkin,
-    "diamondwave": DiamondWaveSkin,
-    "hexgrid": HexGridSkin,
-    "sunburst": SunburstSkin,
-    "quantumwave": QuantumWaveSkin,
-    "vortex": VortexSkin,
-    "hypercube": HypercubeSkin,
-    "mandelbrot": MandelbrotSkin,
-    "fractaltree": FractalTreeSkin,
-    "plasmastorm": PlasmaStormSkin,
-    "prism": PrismSkin,
-    "hexwarp": HexWarpSkin,
-    "auroraflow": AuroraFlowSkin,
-    "vortexmotion": VortexMotionSkin,
-    "depthgrid": DepthGridSkin,
-    "warptunnel": WarpTunnelSkin,
-    "pulsematrix": PulseMatrixSkin,
-    "fractalbloom": FractalBloomSkin,
-    "neuronet": NeuroNetSkin,
-    "fractallattice": FractalLatticeSkin,
-    "moirefield": MoireFieldSkin,
-    "waveformcanvas": WaveformCanvasSkin,
-    "spectrumrain": SpectrumRainSkin,
-    "harmonicflow": HarmonicFlowSkin,
-    "resonancesphere": ResonanceSphereSkin,
-    "harmonicfield": HarmonicFieldSkin,
-    "cymatic": CymaticSkin,
-}
\ No newline at end of file
+# name -> (module, class); a module is only imported once its skin is used
+_SKIN_CLASSES = {
+    "blocks": ("blocks", "BlocksSkin"),
+    "gradient": ("gradient", "GradientSkin"),
+    "sparkline": ("sparkline", "SparklineSkin"),
+    "fire": ("fire", "FireSkin"),
+    "spiral": ("spiral", "SpiralSkin"),
+    "tunnel": ("tunnel", "TunnelSkin"),
+    "aurora": ("aurora", "AuroraSkin"),
+    "diamondwave": ("diamondwave", "DiamondWaveSkin"),
+    "hexgrid": ("hexgrid", "HexGridSkin"),
+    "sunburst": ("sunburst", "SunburstSkin"),
+    "quantumwave": ("quantumwave", "QuantumWaveSkin"),
+    "vortex": ("vortex", "VortexSkin"),
+    "hypercube": ("hypercube", "HypercubeSkin"),
+    "mandelbrot": ("mandelbrot", "MandelbrotSkin"),
+    "fractaltree": ("fractaltree", "FractalTreeSkin"),
+    "plasmastorm": ("plasmastorm", "PlasmaStormSkin"),
+    "prism": ("prism", "PrismSkin"),
+    "hexwarp": ("hexwarp", "HexWarpSkin"),
+    "auroraflow": ("auroraflow", "AuroraFlowSkin"),
+    "vortexmotion": ("vortexmotion", "VortexMotionSkin"),
+    "depthgrid": ("depthgrid", "DepthGridSkin"),
+    "warptunnel": ("warptunnel", "WarpTunnelSkin"),
+    "pulsematrix": ("pulsematrix", "PulseMatrixSkin"),
+    "fractalbloom": ("fractalbloom", "FractalBloomSkin"),
+    "neuronet": ("neuronet", "NeuroNetSkin"),
+    "fractallattice": ("fractallattice", "FractalLatticeSkin"),
+    "moirefield": ("moirefield", "MoireFieldSkin"),
+    "waveformcanvas": ("waveformcanvas", "WaveformCanvasSkin"),
+    "spectrumrain": ("spectrumrain", "SpectrumRainSkin"),
+    "harmonicflow": ("harmonicflow", "HarmonicFlowSkin"),
+    "resonancesphere": ("resonancesphere", "ResonanceSphereSkin"),
+    "harmonicfield": ("harmonicfield", "HarmonicFieldSkin"),
+    "cymatic": ("cymatic", "CymaticSkin"),
+}
+
+
+class SkinRegistry(Mapping):
+    """Skin classes by name, importing each skin's module on first lookup."""
+
+    def __init__(self, entries):
+        self._entries = entries
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._loaded[name]
+        except KeyError:
+            module, cls = self._entries[name]
+            skin = getattr(importlib.import_module("." + module, __name__), cls)
+            self._loaded[name] = skin
+            return skin
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+SKINS = SkinRegistry(_SKIN_CLASSES)
+
+
+def __getattr__(attr):
+    # `from skins import TunnelSkin` still works, loading just that module
+    for name, (module, cls) in _SKIN_CLASSES.items():
+        if cls == attr:
+            return SKINS[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
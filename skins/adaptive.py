@@ -0,0 +1,82 @@
+import math
+import time
+
+from core.analysis import analyze
+from core.display import join_cells, parse_cells
+
+# (columns, rows) each rendered cell covers, from full quality down
+SCALES = [(1, 1), (2, 1), (2, 2), (3, 2), (4, 3)]
+
+
+class AdaptiveQuality:
+    """Wraps a skin, rendering it at reduced resolution while it is too slow.
+
+    Render time is tracked as a moving average. When it goes over
+    `budget` seconds the skin drops to the next entry in SCALES. It is
+    then drawn on a smaller canvas with the spectrum averaged down to
+    match, and each cell is repeated to fill the terminal. When the
+    estimated cost at the next finer scale fits within `headroom` of the
+    budget, quality steps back up. `hold` frames must pass between
+    changes so the scale doesn't flicker.
+    """
+
+    def __init__(self, skin, budget, headroom=0.6, hold=15):
+        self.skin = skin
+        self.name = skin.name
+        self.budget = budget
+        self.headroom = headroom
+        self.hold = hold
+        self.level = 0
+        self.average = None
+        self._frames = 0
+        self._width = skin.num_bands
+        self._height = skin.bar_height
+
+    @property
+    def scale(self):
+        return SCALES[self.level]
+
+    def render(self, norm_energies):
+        start = time.perf_counter()
+        if self.level == 0:
+            screen = self.skin.render(norm_energies)
+        else:
+            screen = self._render_scaled(norm_energies)
+        self._adapt(time.perf_counter() - start)
+        return screen
+
+    def _render_scaled(self, norm_energies):
+        sx, sy = self.scale
+        w, h = self._width, self._height
+        small_w, small_h = math.ceil(w / sx), math.ceil(h / sy)
+        skin = self.skin
+        skin.num_bands, skin.bar_height = small_w, small_h
+        try:
+            small = skin.render(analyze(norm_energies).coarse(small_w))
+        finally:
+            skin.num_bands, skin.bar_height = w, h
+
+        screen = []
+        for line in small:
+            cells = parse_cells(line)
+            row = join_cells([cell for cell in cells for _ in range(sx)][:w])
+            screen.extend([row] * sy)
+        return screen[:h]
+
+    def _adapt(self, seconds):
+        self.average = seconds if self.average is None else 0.8 * self.average + 0.2 * seconds
+        self._frames += 1
+        if self._frames < self.hold:
+            return
+        sx, sy = self.scale
+        if self.average > self.budget and self.level < len(SCALES) - 1:
+            self._step(1)
+        elif self.level > 0:
+            fx, fy = SCALES[self.level - 1]
+            if self.average * (sx * sy) / (fx * fy) < self.budget * self.headroom:
+                self._step(-1)
+
+    def _step(self, direction):
+        self.level += direction
+        self._frames = 0
+        self.average = None
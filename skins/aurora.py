@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class AuroraSkin(BaseSkin):
     name = "aurora"
 
@@ -16,12 +19,12 @@ class AuroraSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        # safe length check for numpy arrays
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
         phase = avg * math.pi * 2.0
 
-        strips = [' ', '·', '░', '▒', '▓', '█']
+        strips = np.array([' ', '·', '░', '▒', '▓', '█'])
         ns = len(strips)
 
         # color ramp for aurora (if available)
@@ -35,28 +38,24 @@ class AuroraSkin(BaseSkin):
                 self.Fore.YELLOW,
             ]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # x-based wave plus band energy-driven jitter
-                band = x % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
-
-                # vertical position bias: center moves by a sinusoid that reacts to energy
-                t = (x / max(1.0, w)) * 2.0 * math.pi * (1.0 + avg * 3.0) + phase
-                wave = math.sin(t + y * 0.2)
-
-                intensity = (wave + 1.0) / 2.0
-                intensity = intensity * 0.6 + e * 0.4
-                idx = int(intensity * (ns - 1))
-                idx = max(0, min(ns - 1, idx))
-                ch = strips[idx]
-
-                if palette:
-                    color = palette[(x + idx) % len(palette)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
+        g = self.geometry
+        x = g.x
+
+        # x-based wave plus band energy-driven jitter, one value per column
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        e = energies[band] if n > 0 else np.zeros(w)
+
+        # vertical position bias: center moves by a sinusoid that reacts to energy.
+        # sin(t + y*0.2) = sin(t)cos(y*0.2) + cos(t)sin(y*0.2): the column
+        # terms change per frame, the row terms only with the size
+        t = (x / max(1.0, w)) * 2.0 * math.pi * (1.0 + avg * 3.0) + phase
+        sin_y, cos_y = g.cached("aurora.rows", lambda g: (np.sin(g.y * 0.2), np.cos(g.y * 0.2)))
+        wave = np.sin(t) * cos_y + np.cos(t) * sin_y
+
+        intensity = (wave + 1.0) / 2.0
+        intensity = intensity * 0.6 + e * 0.4
+        idx = np.clip((intensity * (ns - 1)).astype(int), 0, ns - 1)
+
+        if palette:
+            return join_grid(strips[idx], (np.arange(w) + idx) % len(palette), palette)
+        return join_grid(strips[idx])
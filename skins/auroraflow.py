@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 class AuroraFlowSkin(BaseSkin):
     name = "auroraflow"
@@ -18,7 +19,7 @@ class AuroraFlowSkin(BaseSkin):
             return []
 
         n = len(norm_energies) if hasattr(norm_energies, "__len__") else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        avg = self.analyze(norm_energies).mean
 
         # slow drift and flicker
         drift = avg * 0.6
@@ -62,8 +63,8 @@ class AuroraFlowSkin(BaseSkin):
                     # color mixes by vertical position and intensity for aurora-like bands
                     color_idx = min(len(colors) - 1, int(vy * (len(colors) - 1)))
                     color = colors[(color_idx + idx + band) % len(colors)]
-                    line.append(color + ch + self.Style.RESET_ALL)
+                    line.append((color, ch))
                 else:
-                    line.append(ch)
-            screen.append(''.join(line))
+                    line.append((None, ch))
+            screen.append(join_cells(line))
         return screen
\ No newline at end of file
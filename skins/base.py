@@ -1,9 +1,30 @@
+from core.analysis import analyze
+from .geometry import Geometry
+
+
 class BaseSkin:
     name = "base"
 
     def __init__(self, bar_height, num_bands):
         self.bar_height = bar_height
         self.num_bands = num_bands
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """Coordinate arrays for the current canvas size, shared across skins."""
+        size = (self.num_bands, self.bar_height)
+        if self._geometry is None or (self._geometry.w, self._geometry.h) != size:
+            self._geometry = Geometry.for_size(*size)
+        return self._geometry
+
+    def analyze(self, norm_energies):
+        """Summary statistics of `norm_energies` (see core.analysis.Analysis).
+
+        Free for spectra straight from AudioEngine, which arrive with them
+        precomputed; computed on the spot for plain arrays and lists.
+        """
+        return analyze(norm_energies)
 
     def render(self, norm_energies):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
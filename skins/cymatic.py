@@ -1,5 +1,6 @@
 from .base import BaseSkin
-import math
+from core.display import join_grid
+import numpy as np
 
 class CymaticSkin(BaseSkin):
     name = "cymatic"
@@ -16,7 +17,7 @@ class CymaticSkin(BaseSkin):
         except ImportError:
             self.has_color = False
         self.time = 0
-        self.sand_memory = []  # Store previous frames for persistence
+        self.sand_memory = None  # Previous frame for persistence
 
     def render(self, norm_energies):
         w = self.num_bands
@@ -24,88 +25,78 @@ class CymaticSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        chars = " .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
+        chars = np.array(list(" .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"))
         self.time += 0.05
-        
+
         # Analyze frequency characteristics
-        bass = sum(norm_energies[:len(norm_energies)//4]) / max(1, len(norm_energies)//4)
-        mids = sum(norm_energies[len(norm_energies)//4:3*len(norm_energies)//4]) / max(1, len(norm_energies)//2)
-        highs = sum(norm_energies[3*len(norm_energies)//4:]) / max(1, len(norm_energies)//4)
+        analysis = self.analyze(norm_energies)
+        bass, mids, highs = analysis.bass, analysis.mid, analysis.high
         avg_energy = (bass + mids + highs) / 3
 
         # Initialize sand canvas with persistence
-        if not self.sand_memory:
-            self.sand_memory = [[0.0 for _ in range(w)] for _ in range(h)]
-        
+        if self.sand_memory is None or self.sand_memory.shape != (h, w):
+            self.sand_memory = np.zeros((h, w))
+
         colors = None
         if self.has_color:
             # Color meaning: Bass=Red, Mids=Green, Highs=Blue, Mixed=White/Yellow
-            colors = {
-                'bass': self.Fore.RED + self.Back.BLACK,
-                'mids': self.Fore.GREEN + self.Back.BLACK, 
-                'highs': self.Fore.BLUE + self.Back.BLACK,
-                'full': self.Fore.YELLOW + self.Back.BLACK,
-                'rich': self.Fore.WHITE + self.Back.BLACK
-            }
-
-        screen = []
-        new_sand = [[0.0 for _ in range(w)] for _ in range(h)]
-        
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Normalize coordinates to 3D space
-                nx = (x / w - 0.5) * 4.0
-                ny = (y / h - 0.5) * 3.0
-                
-                # Multiple resonant frequencies (like Chladni plates)
-                freq1 = 3.0 + bass * 5.0  # Bass controls base frequency
-                freq2 = 7.0 + mids * 8.0   # Mids control complexity
-                freq3 = 12.0 + highs * 15.0 # Highs add fine details
-                
-                # Standing wave patterns
-                wave1 = math.sin(nx * freq1 + self.time) * math.cos(ny * freq1)
-                wave2 = math.sin(nx * freq2 * 1.3) * math.cos(ny * freq2 * 0.7 + self.time * 1.5)
-                wave3 = math.sin((nx + ny) * freq3 + self.time * 2) * math.cos((nx - ny) * freq3)
-                
-                # Combine waves with audio modulation
-                combined_wave = (wave1 * (0.4 + bass * 0.3) + 
-                               wave2 * (0.3 + mids * 0.2) + 
-                               wave3 * (0.2 + highs * 0.1))
-                
-                # Add circular nodal patterns
-                radius = math.hypot(nx, ny)
-                circular_wave = math.sin(radius * (8.0 + avg_energy * 6.0) - self.time * 2)
-                final_wave = (combined_wave + circular_wave * 0.4) / 1.4
-                
-                # Sand-like persistence (accumulate and fade)
-                persistence = 0.7
-                new_value = abs(final_wave) * (0.8 + avg_energy * 0.4)
-                sand_value = max(new_value, self.sand_memory[y][x] * persistence)
-                new_sand[y][x] = sand_value
-                
-                # Convert to character with depth perception
-                depth_intensity = sand_value * (0.9 + 0.3 * math.sin(radius * 2))
-                char_idx = min(int(depth_intensity * (len(chars) - 1)), len(chars) - 1)
-                ch = chars[char_idx]
-                
-                if colors and self.has_color:
-                    # Color coding based on frequency dominance and intensity
-                    if bass > 0.6 and sand_value > 0.5:
-                        color = colors['bass']  # Strong bass = Red
-                    elif mids > 0.5 and sand_value > 0.4:
-                        color = colors['mids']  # Prominent mids = Green
-                    elif highs > 0.4 and sand_value > 0.3:
-                        color = colors['highs'] # Crisp highs = Blue
-                    elif bass > 0.4 and mids > 0.4 and highs > 0.3:
-                        color = colors['rich']  # Full spectrum = White
-                    else:
-                        color = colors['full']  # Mixed frequencies = Yellow
-                    
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        
-        self.sand_memory = new_sand
-        return screen
\ No newline at end of file
+            colors = [
+                self.Fore.RED + self.Back.BLACK,    # bass
+                self.Fore.GREEN + self.Back.BLACK,  # mids
+                self.Fore.BLUE + self.Back.BLACK,   # highs
+                self.Fore.WHITE + self.Back.BLACK,  # rich
+                self.Fore.YELLOW + self.Back.BLACK  # full
+            ]
+
+        # Normalize coordinates to 3D space
+        nx, ny, radius, _ = self.geometry.field(4.0, 3.0)
+        depth = self.geometry.cached("cymatic.depth", lambda g: np.sin(radius * 2))
+
+        # Multiple resonant frequencies (like Chladni plates)
+        freq1 = 3.0 + bass * 5.0  # Bass controls base frequency
+        freq2 = 7.0 + mids * 8.0   # Mids control complexity
+        freq3 = 12.0 + highs * 15.0 # Highs add fine details
+
+        # Standing wave patterns; nx is a row and ny a column, so each factor
+        # is evaluated once per column or row and combined by broadcasting
+        wave1 = np.sin(nx * freq1 + self.time) * np.cos(ny * freq1)
+        wave2 = np.sin(nx * freq2 * 1.3) * np.cos(ny * freq2 * 0.7 + self.time * 1.5)
+
+        # sin((nx + ny) * f + 2t) * cos((nx - ny) * f), split with the
+        # angle-sum identities into products of row and column terms
+        a = nx * freq3
+        b = ny * freq3
+        sin_a, cos_a = np.sin(a), np.cos(a)
+        sin_at, cos_at = np.sin(a + self.time * 2), np.cos(a + self.time * 2)
+        sin_b, cos_b = np.sin(b), np.cos(b)
+        wave3 = (sin_at * cos_b + cos_at * sin_b) * (cos_a * cos_b + sin_a * sin_b)
+
+        # Combine waves with audio modulation
+        combined_wave = (wave1 * (0.4 + bass * 0.3) +
+                         wave2 * (0.3 + mids * 0.2) +
+                         wave3 * (0.2 + highs * 0.1))
+
+        # Add circular nodal patterns
+        circular_wave = np.sin(radius * (8.0 + avg_energy * 6.0) - self.time * 2)
+        final_wave = (combined_wave + circular_wave * 0.4) / 1.4
+
+        # Sand-like persistence (accumulate and fade)
+        persistence = 0.7
+        new_value = np.abs(final_wave) * (0.8 + avg_energy * 0.4)
+        sand_value = np.maximum(new_value, self.sand_memory * persistence)
+        self.sand_memory = sand_value
+
+        # Convert to character with depth perception
+        depth_intensity = sand_value * (0.9 + 0.3 * depth)
+        char_idx = np.minimum((depth_intensity * (len(chars) - 1)).astype(int), len(chars) - 1)
+
+        if colors and self.has_color:
+            # Color coding based on frequency dominance and intensity
+            color_idx = np.select(
+                [(bass > 0.6) & (sand_value > 0.5),    # Strong bass = Red
+                 (mids > 0.5) & (sand_value > 0.4),    # Prominent mids = Green
+                 (highs > 0.4) & (sand_value > 0.3)],  # Crisp highs = Blue
+                [0, 1, 2],
+                3 if bass > 0.4 and mids > 0.4 and highs > 0.3 else 4)
+            return join_grid(chars[char_idx], color_idx, colors)
+        return join_grid(chars[char_idx])
@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class DepthGridSkin(BaseSkin):
     name = "depthgrid"
 
@@ -16,39 +19,34 @@ class DepthGridSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
         phase = avg * math.pi * 4.0
 
-        layers = " .'`^\",:;Il!i~+_-?][}{1)(|\\/*tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
+        layers = np.array(list(" .'`^\",:;Il!i~+_-?][}{1)(|\\/*tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"))
         nl = len(layers)
 
         colors = None
         if self.has_color:
             colors = [self.Fore.CYAN, self.Fore.BLUE, self.Fore.MAGENTA, self.Fore.WHITE]
 
-        screen = []
-        for y in range(h):
-            row = []
-            depth = (h - y) / h
-            z = depth + 0.1
-            for x in range(w):
-                band = x % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
-
-                # perspective warp + horizontal motion
-                x_norm = (x - w / 2) / max(1, w / 2)
-                move = math.sin(phase + x_norm * 5.0) * e * 0.4
-
-                # simulate horizon depth fade
-                intensity = max(0.0, min(1.0, (1.0 - z*z) * e * 1.5 + move * 0.6))
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
-
-                if colors:
-                    color = colors[int((depth * 3 + idx) % len(colors))]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        g = self.geometry
+
+        # horizon depth per row
+        depth = (h - g.y) / h
+        z = depth + 0.1
+
+        # band energy, perspective warp and horizontal motion per column
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        e = energies[band] if n > 0 else np.zeros(w)
+        x_norm = (g.x - w / 2) / max(1, w / 2)
+        move = np.sin(phase + x_norm * 5.0) * e * 0.4
+
+        # simulate horizon depth fade
+        intensity = np.clip((1.0 - z*z) * e * 1.5 + move * 0.6, 0.0, 1.0)
+        idx = (intensity * (nl - 1)).astype(int)
+
+        if colors:
+            return join_grid(layers[idx], ((depth * 3 + idx) % len(colors)).astype(int), colors)
+        return join_grid(layers[idx])
@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class DiamondWaveSkin(BaseSkin):
     name = "diamondwave"
 
@@ -9,52 +12,45 @@ class DiamondWaveSkin(BaseSkin):
         self.Fore = Fore
         self.Style = Style
 
-    def render(self, norm_energies):
-        import math
+    @staticmethod
+    def _distance(g):
+        # build a diamond lattice using manhattan-like metric rotated
+        cx = (g.w - 1) / 2.0
+        cy = (g.h - 1) / 2.0
+        rx = (g.x - cx) / max(1.0, cx)
+        ry = (g.y - cy) / max(1.0, cy)
+        return np.abs(rx) + np.abs(ry)
 
+    def render(self, norm_energies):
         w = self.num_bands
         h = self.bar_height
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         # diamond characters (outline -> filled)
-        diamonds = [' ', '.', '*', 'o', 'O', '#']
+        diamonds = np.array([' ', '.', '*', 'o', 'O', '#'])
         nd = len(diamonds)
 
         palette = None
         if self.has_color:
             palette = [self.Fore.CYAN, self.Fore.MAGENTA, self.Fore.YELLOW, self.Fore.GREEN, self.Fore.RED]
 
-        screen = []
-        cx = (w - 1) / 2.0
-        cy = (h - 1) / 2.0
-
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # build a diamond lattice using manhattan-like metric rotated
-                rx = (x - cx) / max(1.0, cx)
-                ry = (y - cy) / max(1.0, cy)
-                d = abs(rx) + abs(ry)
-
-                # per-column band modulation
-                band = x % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
-
-                # wave ripple that depends on distance and average energy
-                ripple = 0.5 + 0.5 * math.sin(d * 8.0 - avg * 10.0 + band * 0.3)
-
-                intensity = max(0.0, min(1.0, ripple * (0.5 + e * 0.8)))
-                idx = int(intensity * (nd - 1))
-                ch = diamonds[idx]
-
-                if palette:
-                    color = palette[(idx + band) % len(palette)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
+        d = self.geometry.cached("diamondwave.distance", self._distance)
+
+        # per-column band modulation
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        e = energies[band] if n > 0 else np.zeros(w)
+
+        # wave ripple that depends on distance and average energy
+        ripple = 0.5 + 0.5 * np.sin(d * 8.0 - avg * 10.0 + band * 0.3)
+
+        intensity = np.clip(ripple * (0.5 + e * 0.8), 0.0, 1.0)
+        idx = (intensity * (nd - 1)).astype(int)
+
+        if palette:
+            return join_grid(diamonds[idx], (idx + band) % len(palette), palette)
+        return join_grid(diamonds[idx])
@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 class FireSkin(BaseSkin):
     name = "fire"
@@ -23,7 +24,7 @@ class FireSkin(BaseSkin):
 
         screen = []
         for row in range(self.bar_height):
-            line = ""
+            line = []
             for h in norm_energies:
                 # determine if this row should be filled for this band
                 filled = row >= (self.bar_height - int(h * self.bar_height))
@@ -34,9 +35,8 @@ class FireSkin(BaseSkin):
                     # color based on vertical position (top->yellow, mid->red, bottom->magenta)
                     pos = row / max(1, (self.bar_height - 1))
                     color = colors[min(int(pos * len(colors)), len(colors) - 1)]
-                    line += color + ch
+                    line.append((color, ch))
                 else:
-                    line += " "
-            line += self.Style.RESET_ALL
-            screen.append(line)
+                    line.append((None, " "))
+            screen.append(join_cells(line))
         return screen
@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class FractalBloomSkin(BaseSkin):
     name = "fractalbloom"
 
@@ -16,43 +19,38 @@ class FractalBloomSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         cx, cy = (w - 1) / 2.0, (h - 1) / 2.0
         phase = avg * math.pi * 5.0
 
-        layers = " .`'-,^*+xX#%@"
+        layers = np.array(list(" .`'-,^*+xX#%@"))
         nl = len(layers)
 
         colors = None
         if self.has_color:
             colors = [self.Fore.MAGENTA, self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN, self.Fore.WHITE]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                dx, dy = (x - cx) / max(1, cx), (y - cy) / max(1, cy)
-                r = math.sqrt(dx*dx + dy*dy)
-                theta = math.atan2(dy, dx)
-
-                # multi-harmonic flower pattern
-                petal = math.sin(6 * theta + phase)
-                ring = math.sin((r * 10.0) - phase * 2.0)
-                bloom = (petal * ring + 1.0) / 2.0
-
-                band = int(abs(math.sin(theta * 3)) * n) % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
-
-                intensity = max(0.0, min(1.0, bloom * 0.8 + e * 1.2 - r * 0.2))
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
-
-                if colors:
-                    color = colors[(idx + band + int(petal * 3)) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        g = self.geometry
+        scale_x, scale_y = max(1, cx), max(1, cy)
+        r, theta = g.polar(cx, cy, scale_x, scale_y)
+
+        # multi-harmonic flower pattern
+        petal = np.sin(6 * theta + phase)
+        ring = np.sin((r * 10.0) - phase * 2.0)
+        bloom = (petal * ring + 1.0) / 2.0
+
+        if n > 0:
+            band = g.angle_bands(n, cx, cy, scale_x, scale_y, harmonic=3)
+            e = energies[band]
+        else:
+            band, e = 0, 0.0
+
+        intensity = np.clip(bloom * 0.8 + e * 1.2 - r * 0.2, 0.0, 1.0)
+        idx = (intensity * (nl - 1)).astype(int)
+
+        if colors:
+            return join_grid(layers[idx], (idx + band + (petal * 3).astype(int)) % len(colors), colors)
+        return join_grid(layers[idx])
@@ -1,6 +1,7 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
-import math
+import numpy as np
 
 class FractalLatticeSkin(BaseSkin):
     name = "fractallattice"
@@ -16,49 +17,41 @@ class FractalLatticeSkin(BaseSkin):
             self.has_color = False
         self.iteration = 0
 
-    def _sierpinski(self, x, y, depth, energy):
-        if depth == 0:
-            return 1
-        step = 2 ** depth
-        if (x // step) % 2 == 1 and (y // step) % 2 == 1:
-            return 0
-        return self._sierpinski(x, y, depth - 1, energy)
+    @staticmethod
+    def _sierpinski(g, depth):
+        # a cell is cleared when x // 2**d and y // 2**d are both odd for
+        # some d in 1..depth, i.e. when x & y has any of those bits set
+        both = g.cached("fractallattice.and", lambda g: g.x.astype(int) & g.y.astype(int))
+        bits = (1 << (depth + 1)) - 2
+        return (both & bits) == 0
 
     def render(self, norm_energies):
         w, h = self.num_bands, self.bar_height
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
         if n == 0:
-            norm_energies = [0.0] * w
+            energies = np.zeros(w)
             n = w
 
         # Dynamic recursion depth based on avg energy
-        avg = sum(norm_energies) / n if n > 0 else 0.0
+        avg = self.analyze(norm_energies).mean
         max_depth = max(1, min(5, int(avg * 4) + 1))
 
-        chars = " ▄▀█"
+        chars = np.array(list(" ▄▀█"))
         colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.WHITE] if self.has_color else None
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                band = x % n
-                energy = norm_energies[band]
-                # Modulate fractal presence by local energy
-                if energy < 0.1:
-                    ch = " "
-                else:
-                    val = self._sierpinski(x, y, max_depth, energy)
-                    idx = int(val * (len(chars) - 1))
-                    ch = chars[idx]
+        g = self.geometry
+        energy = energies[np.arange(w) % n]
+        val = self._sierpinski(g, max_depth)
+        idx = (val * (len(chars) - 1)).astype(int)
 
-                if colors:
-                    color = colors[(x + y + int(energy * 10)) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # Modulate fractal presence by local energy
+        cells = np.where(energy < 0.1, " ", chars[idx])
+
+        if colors:
+            tint = g.cached("fractallattice.tint", lambda g: (g.x + g.y).astype(int))
+            return join_grid(cells, (tint + (energy * 10).astype(int)) % len(colors), colors)
+        return join_grid(cells)
@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 import math
 import random
@@ -27,7 +28,8 @@ class FractalTreeSkin(BaseSkin):
         # Initialize canvas
         canvas = [[' ' for _ in range(w)] for _ in range(h)]
         
-        avg_energy = sum(norm_energies) / len(norm_energies)
+        analysis = self.analyze(norm_energies)
+        avg_energy = analysis.mean
         self.time += 0.1 + avg_energy * 0.1
         
         # Tree parameters modulated by audio
@@ -84,7 +86,7 @@ class FractalTreeSkin(BaseSkin):
         
         # Add falling "leaves" or particles based on high frequencies
         if avg_energy > 0.3:
-            high_freq_energy = sum(norm_energies[-len(norm_energies)//4:]) / max(1, len(norm_energies)//4)
+            high_freq_energy = analysis.high
             num_particles = int(high_freq_energy * 10)
             
             for _ in range(num_particles):
@@ -107,10 +109,10 @@ class FractalTreeSkin(BaseSkin):
                     if colors and self.has_color:
                         # Color based on vertical position and energy
                         color_idx = int((y / h + self.time * 0.1) * len(colors)) % len(colors)
-                        row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
+                        row.append((colors[color_idx], ch))
                     else:
-                        row.append(ch)
+                        row.append((None, ch))
                 else:
-                    row.append(' ')
-            screen.append(''.join(row))
+                    row.append((None, ' '))
+            screen.append(join_cells(row))
         return screen
\ No newline at end of file
@@ -0,0 +1,120 @@
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+# Centered coordinates scaled per axis, plus their polar form. nx is a
+# (1, w) row and ny an (h, 1) column, so terms in only one of them cost
+# O(w) or O(h) and broadcast to the (h, w) radius and angle.
+Field = namedtuple("Field", "nx ny radius angle")
+
+# Unit sphere projected onto the canvas. Pixels outside `mask` hold
+# zeros; `lighting` is the Lambert-style shade for a fixed light.
+Sphere = namedtuple("Sphere", "mask nx ny z r theta phi lighting")
+
+# Distance and angle (atan2, in -pi..pi) of each cell from a center.
+Polar = namedtuple("Polar", "r theta")
+
+LIGHT_DIR = (0.3, 0.5, 1.0)
+
+_shared = OrderedDict()
+_SHARED_SIZES = 4
+
+
+class Geometry:
+    """Coordinate arrays for one canvas size, built once and reused every frame.
+
+    `x` is a (1, w) row of column indices and `y` an (h, 1) column of row
+    indices, so expressions in both broadcast to the full (h, w) grid.
+    Anything else that depends only on the size can be memoized with
+    `cached`.
+    """
+
+    def __init__(self, w, h):
+        self.w = w
+        self.h = h
+        self.x = np.arange(w, dtype=np.float64)[np.newaxis, :]
+        self.y = np.arange(h, dtype=np.float64)[:, np.newaxis]
+        self._cache = {}
+
+    @classmethod
+    def for_size(cls, w, h):
+        """Return the instance shared by every skin drawing at `w` x `h`.
+
+        Only the last few sizes are kept, so resizing a terminal back and
+        forth is cheap without the cache growing on every resize.
+        """
+        key = (w, h)
+        try:
+            _shared.move_to_end(key)
+            return _shared[key]
+        except KeyError:
+            geometry = _shared[key] = cls(w, h)
+            while len(_shared) > _SHARED_SIZES:
+                _shared.popitem(last=False)
+            return geometry
+
+    def cached(self, key, build):
+        """Return `build(self)`, computing it only the first time `key` is asked for."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build(self)
+            return value
+
+    def field(self, scale_x=2.0, scale_y=2.0):
+        """Centered coordinates (x/w - 0.5) * scale_x, (y/h - 0.5) * scale_y."""
+        return self.cached(("field", scale_x, scale_y), lambda g: g._build_field(scale_x, scale_y))
+
+    def sphere(self):
+        """Per-pixel position, normal and lighting on the unit sphere."""
+        return self.cached("sphere", Geometry._build_sphere)
+
+    def product(self):
+        """x * y of every cell as integers, for skins that index by it."""
+        return self.cached("product", lambda g: (g.x * g.y).astype(int))
+
+    def polar(self, cx, cy, scale_x=1.0, scale_y=1.0):
+        """Polar coordinates about (cx, cy), offsets divided by scale_x and scale_y."""
+        key = ("polar", cx, cy, scale_x, scale_y)
+        return self.cached(key, lambda g: g._build_polar(cx, cy, scale_x, scale_y))
+
+    def angle_bands(self, n, cx, cy, scale_x=1.0, scale_y=1.0, harmonic=1):
+        """Band index int(|sin(harmonic * theta)| * n) % n of each cell in `polar`.
+
+        This is how the radial skins pick a spectrum band by angle; it
+        only changes with the size and the number of bands.
+        """
+        key = ("angle_bands", n, cx, cy, scale_x, scale_y, harmonic)
+        theta = self.polar(cx, cy, scale_x, scale_y).theta
+        return self.cached(key, lambda g: (np.abs(np.sin(theta * harmonic)) * n).astype(int) % n)
+
+    def _build_field(self, scale_x, scale_y):
+        nx = (self.x / self.w - 0.5) * scale_x
+        ny = (self.y / self.h - 0.5) * scale_y
+        return Field(nx, ny, np.hypot(nx, ny), np.arctan2(ny, nx))
+
+    def _build_polar(self, cx, cy, scale_x, scale_y):
+        dx = (self.x - cx) / scale_x
+        dy = (self.y - cy) / scale_y
+        return Polar(np.hypot(dx, dy), np.arctan2(dy, dx))
+
+    def _build_sphere(self):
+        f = self.field(2.0, 2.0)
+        r_squared = f.nx * f.nx + f.ny * f.ny
+        mask = r_squared <= 1.0
+        r_squared = np.where(mask, r_squared, 0.0)
+        nx = np.where(mask, f.nx, 0.0)
+        ny = np.where(mask, f.ny, 0.0)
+
+        # the surface normal of a unit sphere is the point itself
+        z = np.sqrt(1.0 - r_squared)
+        r = np.sqrt(r_squared)
+        theta = np.where(mask, f.angle, 0.0)
+        phi = np.arcsin(r)
+
+        lx, ly, lz = LIGHT_DIR
+        light_len = np.sqrt(lx * lx + ly * ly + lz * lz)
+        normal_len = np.sqrt(nx * nx + ny * ny + z * z)
+        dot_product = (nx * lx + ny * ly + z * lz) / (normal_len * light_len)
+        lighting = np.where(mask, np.maximum(0.3, (dot_product + 1.0) / 2.0), 0.0)
+        return Sphere(mask, nx, ny, z, r, theta, phi, lighting)
@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 class GradientSkin(BaseSkin):
     name = "gradient"
@@ -27,12 +28,12 @@ class GradientSkin(BaseSkin):
         ]
         screen = []
         for row in range(self.bar_height):
-            line = ""
+            line = []
             for h in norm_energies:
                 if row >= (self.bar_height - int(h * self.bar_height)):
                     idx = min(int(h * len(colors)), len(colors) - 1)
-                    line += colors[idx] + "█"
+                    line.append((colors[idx], "█"))
                 else:
-                    line += " "
-            screen.append(line + self.Style.RESET_ALL)
+                    line.append((None, " "))
+            screen.append(join_cells(line))
         return screen
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
-import math
+import numpy as np
 
 class HarmonicFlowSkin(BaseSkin):
     name = "harmonicflow"
@@ -22,63 +23,47 @@ class HarmonicFlowSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
         if n == 0:
-            norm_energies = [0.0] * w
+            energies = np.zeros(w)
             n = w
 
-        avg_energy = sum(norm_energies) / n
+        avg_energy = self.analyze(norm_energies).mean
         self.time += 0.05 + avg_energy * 0.1
 
-        # Smooth waveform using sine interpolation
-        def smooth_sample(x):
-            if n <= 1:
-                return norm_energies[0] if n == 1 else 0.0
+        g = self.geometry
+        x = g.x
+
+        # Smooth waveform: linear interpolation of the spectrum, one sample per column
+        if n <= 1:
+            energy = np.full((1, w), energies[0])
+        else:
             t = x * (n - 1) / max(1, w - 1)
-            i = int(t)
+            i = t.astype(int)
             frac = t - i
-            a = norm_energies[max(0, min(i, n - 1))]
-            b = norm_energies[max(0, min(i + 1, n - 1))]
-            return a + (b - a) * frac
+            a = energies[np.clip(i, 0, n - 1)]
+            b = energies[np.clip(i + 1, 0, n - 1)]
+            energy = a + (b - a) * frac
 
         # Flowing wave character set
-        flow_chars = " ~≈≋∿﹏"
-
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Sample smooth energy
-                energy = smooth_sample(x)
-
-                # Simulate wave displacement
-                displacement = math.sin(x * 0.1 + self.time) * 0.3 + \
-                               math.sin(x * 0.05 + self.time * 0.7) * 0.2
-                y_wave = (y / h) + displacement * energy * 0.8
-
-                # Only draw if near wave center
-                wave_center = energy * 0.8
-                dist = abs(y_wave - wave_center)
-                if dist > 0.15:
-                    ch = " "
-                else:
-                    intensity = 1.0 - (dist / 0.15)
-                    idx = int(intensity * (len(flow_chars) - 1))
-                    ch = flow_chars[idx]
+        flow_chars = np.array(list(" ~≈≋∿﹏"))
 
-                if self.has_color and ch != " ":
-                    # Color flows from blue → white → red with energy
-                    if energy < 0.3:
-                        color = self.Fore.BLUE
-                    elif energy < 0.6:
-                        color = self.Fore.CYAN
-                    elif energy < 0.85:
-                        color = self.Fore.YELLOW
-                    else:
-                        color = self.Fore.RED
-                    ch = color + ch + self.Style.RESET_ALL
+        # Simulate wave displacement; it only depends on the column
+        displacement = np.sin(x * 0.1 + self.time) * 0.3 + \
+                       np.sin(x * 0.05 + self.time * 0.7) * 0.2
+        y_wave = (g.y / h) + displacement * energy * 0.8
 
-                row.append(ch)
-            screen.append(''.join(row))
+        # Only draw if near wave center
+        wave_center = energy * 0.8
+        dist = np.abs(y_wave - wave_center)
+        intensity = 1.0 - (dist / 0.15)
+        idx = np.where(dist > 0.15, 0, (intensity * (len(flow_chars) - 1)).astype(int))
+        chars = flow_chars[idx]
 
-        return screen
\ No newline at end of file
+        if self.has_color:
+            # Color flows from blue → white → red with energy
+            palette = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.YELLOW, self.Fore.RED]
+            color_idx = np.searchsorted([0.3, 0.6, 0.85], energy, side="right")
+            return join_grid(chars, np.where(chars != " ", color_idx, -1), palette)
+        return join_grid(chars)
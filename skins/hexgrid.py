@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class HexGridSkin(BaseSkin):
     name = "hexgrid"
 
@@ -9,6 +12,14 @@ class HexGridSkin(BaseSkin):
         self.Fore = Fore
         self.Style = Style
 
+    @staticmethod
+    def _cells(g):
+        # axial-like coordinates: shift every other row
+        y_scale = 0.5
+        sx = g.x + np.where(g.y % 2 == 0, 0.5, 0.0)
+        sy = g.y * (1.0 / y_scale)
+        return sx, sy
+
     def render(self, norm_energies):
         import math
 
@@ -17,11 +28,12 @@ class HexGridSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         # characters approximating hex cells (alternating rows shifted)
-        cells = [' ', '·', '○', '●', '◆', '■']
+        cells = np.array([' ', '·', '○', '●', '◆', '■'])
         nc = len(cells)
 
         palette = None
@@ -32,37 +44,24 @@ class HexGridSkin(BaseSkin):
         x_scale = 1.0
         y_scale = 0.5
 
-        screen = []
-        for row in range(h):
-            line = []
-            for col in range(w):
-                # axial-like coordinates: shift every other row
-                sx = col + (0.5 if row % 2 == 0 else 0.0)
-                sy = row * (1.0 / y_scale)
-
-                # distance from a moving center that reacts to avg energy
-                cx = (w - 1) / 2.0 + math.sin(avg * 2.0 * math.pi) * (w * 0.05)
-                cy = (h - 1) / 2.0
-
-                dx = (sx - cx) * x_scale
-                dy = (sy - cy) * y_scale
-                r = math.hypot(dx, dy)
+        g = self.geometry
+        sx, sy = g.cached("hexgrid.cells", self._cells)
 
-                # sample a band to modulate the cell (wrap if needed)
-                band = col % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
+        # distance from a moving center that reacts to avg energy
+        cx = (w - 1) / 2.0 + math.sin(avg * 2.0 * math.pi) * (w * 0.05)
+        cy = (h - 1) / 2.0
+        r = np.hypot((sx - cx) * x_scale, (sy - cy) * y_scale)
 
-                # rhythmic ring effect plus per-band pulse
-                ring = 0.5 + 0.5 * math.sin(r * 1.5 - avg * 6.0 + col * 0.1)
-                intensity = max(0.0, min(1.0, ring * (0.6 + e * 0.8)))
+        # sample a band per column to modulate the cell (wrap if needed)
+        col = np.arange(w)
+        band = col % n if n > 0 else np.zeros(w, dtype=int)
+        e = energies[band] if n > 0 else np.zeros(w)
 
-                idx = int(intensity * (nc - 1))
-                ch = cells[idx]
+        # rhythmic ring effect plus per-band pulse
+        ring = 0.5 + 0.5 * np.sin(r * 1.5 - avg * 6.0 + col * 0.1)
+        intensity = np.clip(ring * (0.6 + e * 0.8), 0.0, 1.0)
 
-                if palette:
-                    color = palette[(idx + band) % len(palette)]
-                    line.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    line.append(ch)
-            screen.append(''.join(line))
-        return screen
+        idx = (intensity * (nc - 1)).astype(int)
+        if palette:
+            return join_grid(cells[idx], (idx + band) % len(palette), palette)
+        return join_grid(cells[idx])
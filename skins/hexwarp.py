@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class HexWarpSkin(BaseSkin):
     name = "hexwarp"
 
@@ -13,6 +16,17 @@ class HexWarpSkin(BaseSkin):
         except ImportError:
             self.has_color = False
 
+    @staticmethod
+    def _warp(g):
+        cx = (g.w - 1) / 2.0
+        cy = (g.h - 1) / 2.0
+        # stagger for "hex" look: every other row offsets the warp pattern
+        row_offset = np.where(g.y % 2 == 1, 0.5, 0.0)
+        x_norm = (g.x + row_offset - cx) / max(1.0, cx)
+        y_norm = (g.y - cy) / max(1.0, cy)
+        diagonal = (g.x + g.y).astype(int)
+        return np.hypot(x_norm, y_norm), diagonal
+
     def render(self, norm_energies):
         import math
 
@@ -21,50 +35,37 @@ class HexWarpSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, "__len__") else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         phase = avg * math.pi * 2.0
         freq = 1.8 + avg * 4.0
 
-        layers = " .·oO0@#"
+        layers = np.array(list(" .·oO0@#"))
         nl = len(layers)
 
         colors = None
         if self.has_color:
             colors = [self.Fore.CYAN, self.Fore.GREEN, self.Fore.YELLOW, self.Fore.MAGENTA, self.Fore.RED]
 
-        cx = (w - 1) / 2.0
-        cy = (h - 1) / 2.0
-
-        screen = []
-        for y in range(h):
-            row = []
-            # stagger for "hex" look: every other row offsets the warp pattern
-            row_offset = 0.5 if (y % 2) == 1 else 0.0
-            for x in range(w):
-                # compute a geometric warp field
-                x_norm = (x + row_offset - cx) / max(1.0, cx)
-                y_norm = (y - cy) / max(1.0, cy)
-                r = math.hypot(x_norm, y_norm)
-
-                # sample band safely (use x as band index)
-                band = x % n if n > 0 else 0
-                energy = norm_energies[band] if n > 0 else 0.0
+        # geometric warp field and x + y of each cell, fixed for the size
+        g = self.geometry
+        r, diagonal = g.cached("hexwarp.warp", self._warp)
 
-                # warp combines radial ripples and diagonal shear for hex effect
-                ripple = (math.sin(r * (freq * 3.0) - phase * (0.5 + energy)) + 1.0) / 2.0
-                shear = (math.sin((x + y) * 0.3 + phase * 0.7) + 1.0) / 2.0
+        # sample band safely (use x as band index)
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        energy = energies[band] if n > 0 else np.zeros(w)
 
-                intensity = max(0.0, min(1.0, energy * 0.85 + ripple * 0.6 + shear * 0.25 - r * 0.2))
+        # warp combines radial ripples and diagonal shear for hex effect;
+        # the shear is constant along each diagonal, so it is evaluated per diagonal
+        ripple = (np.sin(r * (freq * 3.0) - phase * (0.5 + energy)) + 1.0) / 2.0
+        shear = (np.sin(np.arange(w + h - 1) * 0.3 + phase * 0.7) + 1.0) / 2.0
+        shear = shear[diagonal]
 
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
+        intensity = np.clip(energy * 0.85 + ripple * 0.6 + shear * 0.25 - r * 0.2, 0.0, 1.0)
+        idx = (intensity * (nl - 1)).astype(int)
 
-                if colors:
-                    color = colors[(idx + band + y) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        if colors:
+            return join_grid(layers[idx], (idx + band + np.arange(h)[:, np.newaxis]) % len(colors), colors)
+        return join_grid(layers[idx])
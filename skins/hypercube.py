@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 import math
 
@@ -22,7 +23,7 @@ class HypercubeSkin(BaseSkin):
             return []
 
         n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = sum(norm_energies) / n if n > 0 else 0.0
+        avg = self.analyze(norm_energies).mean
 
         # Update time based on audio activity
         self.t += 0.02 + avg * 0.05
@@ -81,7 +82,7 @@ class HypercubeSkin(BaseSkin):
                 screen_points.add((px, py, i))
 
         # Build screen
-        grid = [[" "] * w for _ in range(h)]
+        grid = [[(None, " ")] * w for _ in range(h)]
         chars = ".:+=*#%@"
         colors = [self.Fore.MAGENTA, self.Fore.BLUE, self.Fore.CYAN] if self.has_color else None
 
@@ -91,8 +92,8 @@ class HypercubeSkin(BaseSkin):
             ch = chars[char_idx]
             if colors:
                 color = colors[idx % len(colors)]
-                grid[py][px] = color + ch + self.Style.RESET_ALL
+                grid[py][px] = (color, ch)
             else:
-                grid[py][px] = ch
+                grid[py][px] = (None, ch)
 
-        return [''.join(row) for row in grid]
\ No newline at end of file
+        return [join_cells(row) for row in grid]
\ No newline at end of file
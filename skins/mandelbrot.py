@@ -1,6 +1,36 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
 import math
+import numpy as np
+
+
+def escape_time(cx, cy, max_iter, drift=0.0):
+    """Iteration counts of z -> z*z + c for every point at once.
+
+    `cx`/`cy` are same-shaped arrays and `drift` an extra push added to
+    the imaginary part each step. Points drop out of the working set as
+    soon as they escape, so later iterations only touch the bounded ones.
+    """
+    shape = np.broadcast(cx, cy, drift).shape
+    cx = np.broadcast_to(cx, shape).ravel()
+    cy = np.broadcast_to(cy, shape).ravel()
+    drift = np.broadcast_to(drift, shape).ravel()
+    counts = np.zeros(cx.size, dtype=int)
+    active = np.arange(cx.size)
+    zx = np.zeros(cx.size)
+    zy = np.zeros(cx.size)
+    for _ in range(max_iter):
+        inside = zx * zx + zy * zy < 4
+        if not inside.all():
+            active, zx, zy = active[inside], zx[inside], zy[inside]
+            cx, cy, drift = cx[inside], cy[inside], drift[inside]
+            if active.size == 0:
+                break
+        zx, zy = zx * zx - zy * zy + cx, 2 * zx * zy + cy + drift
+        counts[active] += 1
+    return counts.reshape(shape)
+
 
 class MandelbrotSkin(BaseSkin):
     name = "mandelbrot"
@@ -22,11 +52,13 @@ class MandelbrotSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        chars = " ·∙°○●◎◍◆◘@"
+        chars = np.array(list(" ·∙°○●◎◍◆◘@"))
         self.time += 0.05
-        
-        avg_energy = sum(norm_energies) / len(norm_energies)
-        
+
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg_energy = self.analyze(norm_energies).mean
+
         # Audio-modulated fractal parameters
         zoom = 1.5 + math.sin(self.time * 0.5) * 0.3 + avg_energy * 0.5
         move_x = math.sin(self.time * 0.3) * 0.5 + avg_energy * 0.2
@@ -35,43 +67,30 @@ class MandelbrotSkin(BaseSkin):
 
         colors = None
         if self.has_color:
-            colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN, 
+            colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN,
                      self.Fore.YELLOW, self.Fore.RED, self.Fore.MAGENTA]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Convert pixel to complex plane coordinates
-                zx = 1.5 * (x - w / 2) / (0.5 * zoom * w) + move_x
-                zy = (y - h / 2) / (0.5 * zoom * h) + move_y
-                
-                # Audio influence on initial point
-                band_x = int((zx + 2) / 4 * len(norm_energies)) % len(norm_energies)
-                band_y = int((zy + 2) / 4 * len(norm_energies)) % len(norm_energies)
-                audio_influence = (norm_energies[band_x] + norm_energies[band_y]) * 0.1
-                
-                cx = zx + audio_influence * math.sin(self.time)
-                cy = zy + audio_influence * math.cos(self.time)
-                
-                # Modified Mandelbrot iteration
-                zx, zy = 0, 0
-                iter_count = 0
-                while zx * zx + zy * zy < 4 and iter_count < max_iter:
-                    tmp = zx * zx - zy * zy + cx
-                    zy = 2 * zx * zy + cy + audio_influence * 0.1
-                    zx = tmp
-                    iter_count += 1
-
-                # Map iteration count to character
-                intensity = iter_count / max_iter
-                char_idx = min(int(intensity * (len(chars) - 1)), len(chars) - 1)
-                ch = chars[char_idx]
-
-                if colors and self.has_color:
-                    color_idx = int((iter_count + self.time * 5) * 0.5) % len(colors)
-                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # Convert pixels to complex plane coordinates
+        g = self.geometry
+        zx = 1.5 * (g.x - w / 2) / (0.5 * zoom * w) + move_x
+        zy = (g.y - h / 2) / (0.5 * zoom * h) + move_y
+
+        # Audio influence on initial point
+        band_x = ((zx + 2) / 4 * n).astype(int) % n
+        band_y = ((zy + 2) / 4 * n).astype(int) % n
+        audio_influence = (energies[band_x] + energies[band_y]) * 0.1
+
+        cx = zx + audio_influence * math.sin(self.time)
+        cy = zy + audio_influence * math.cos(self.time)
+
+        # Modified Mandelbrot iteration
+        iter_count = escape_time(cx, cy, max_iter, audio_influence * 0.1)
+
+        # Map iteration count to character
+        intensity = iter_count / max_iter
+        char_idx = np.minimum((intensity * (len(chars) - 1)).astype(int), len(chars) - 1)
+
+        if colors and self.has_color:
+            color_idx = ((iter_count + self.time * 5) * 0.5).astype(int) % len(colors)
+            return join_grid(chars[char_idx], color_idx, colors)
+        return join_grid(chars[char_idx])
@@ -1,6 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
 import math
+import numpy as np
 
 class MoireFieldSkin(BaseSkin):
     name = "moirefield"
@@ -21,62 +23,54 @@ class MoireFieldSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
         if n == 0:
-            norm_energies = [0.5] * w
+            energies = np.full(w, 0.5)
             n = w
 
         # Split spectrum: low = global scale, high = local noise
-        low_avg = sum(norm_energies[:max(1, n // 4)]) / max(1, n // 4)
-        high_avg = sum(norm_energies[-max(1, n // 4):]) / max(1, n // 4)
+        low_avg = energies[:max(1, n // 4)].sum() / max(1, n // 4)
+        high_avg = energies[-max(1, n // 4):].sum() / max(1, n // 4)
 
         self.phase += 0.03 + low_avg * 0.05
 
-        chars = " .:-=+*#%@"
+        chars = np.array(list(" .:-=+*#%@"))
         colors = [self.Fore.GREEN, self.Fore.YELLOW, self.Fore.RED] if self.has_color else None
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Normalized coords
-                u = x / max(1, w - 1)
-                v = y / max(1, h - 1)
-
-                # Base moiré: two rotating grids
-                freq1 = 8.0 + low_avg * 12.0
-                freq2 = 6.0 + low_avg * 10.0
-                angle1 = self.phase
-                angle2 = -self.phase + 0.3
-
-                # Grid 1
-                x1 = u * math.cos(angle1) - v * math.sin(angle1)
-                y1 = u * math.sin(angle1) + v * math.cos(angle1)
-                pattern1 = math.sin(x1 * freq1) * math.sin(y1 * freq1)
-
-                # Grid 2
-                x2 = u * math.cos(angle2) - v * math.sin(angle2)
-                y2 = u * math.sin(angle2) + v * math.cos(angle2)
-                pattern2 = math.sin(x2 * freq2) * math.sin(y2 * freq2)
-
-                # Interference
-                moire = (pattern1 + pattern2) / 2.0
-
-                # Local perturbation from high frequencies
-                band_idx = (x + y) % n
-                noise = (norm_energies[band_idx] - 0.5) * 2.0
-                moire += noise * high_avg * 0.5
-
-                intensity = (moire + 1.0) / 2.0
-                intensity = max(0.0, min(1.0, intensity))
-
-                idx = int(intensity * (len(chars) - 1))
-                ch = chars[idx]
-
-                if colors:
-                    color_idx = int(u * len(colors)) % len(colors)
-                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # Normalized coords
+        g = self.geometry
+        u = g.x / max(1, w - 1)
+        v = g.y / max(1, h - 1)
+
+        # Base moiré: two rotating grids
+        freq1 = 8.0 + low_avg * 12.0
+        freq2 = 6.0 + low_avg * 10.0
+        angle1 = self.phase
+        angle2 = -self.phase + 0.3
+
+        # Grid 1
+        x1 = u * math.cos(angle1) - v * math.sin(angle1)
+        y1 = u * math.sin(angle1) + v * math.cos(angle1)
+        pattern1 = np.sin(x1 * freq1) * np.sin(y1 * freq1)
+
+        # Grid 2
+        x2 = u * math.cos(angle2) - v * math.sin(angle2)
+        y2 = u * math.sin(angle2) + v * math.cos(angle2)
+        pattern2 = np.sin(x2 * freq2) * np.sin(y2 * freq2)
+
+        # Interference
+        moire = (pattern1 + pattern2) / 2.0
+
+        # Local perturbation from high frequencies
+        band_idx = g.cached(("moirefield.bands", n), lambda g: (g.x + g.y).astype(int) % n)
+        noise = (energies[band_idx] - 0.5) * 2.0
+        moire += noise * high_avg * 0.5
+
+        intensity = np.clip((moire + 1.0) / 2.0, 0.0, 1.0)
+        idx = (intensity * (len(chars) - 1)).astype(int)
+
+        if colors:
+            color_idx = (u * len(colors)).astype(int) % len(colors)
+            return join_grid(chars[idx], color_idx, colors)
+        return join_grid(chars[idx])
@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class NeuroNetSkin(BaseSkin):
     name = "neuronet"
 
@@ -10,17 +13,18 @@ class NeuroNetSkin(BaseSkin):
         self.Style = Style
 
     def render(self, norm_energies):
-        import math, random
+        import math
 
         w, h = self.num_bands, self.bar_height
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         phase = avg * math.pi * 8.0
-        layers = " .`'~-^:+*xX#%@"
+        layers = np.array(list(" .`'~-^:+*xX#%@"))
         nl = len(layers)
 
         colors = None
@@ -33,29 +37,22 @@ class NeuroNetSkin(BaseSkin):
                 self.Fore.YELLOW,
             ]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # normalized coordinates
-                nx, ny = x / max(1, w), y / max(1, h)
-                e = norm_energies[int(nx * n) % n] if n > 0 else 0.0
-
-                # multi-layer interference pattern
-                layer1 = math.sin((nx * 6 + phase) * (1.2 + e))
-                layer2 = math.cos((ny * 8 - phase * 0.8) * (1.3 + e * 0.5))
-                layer3 = math.sin((nx + ny + phase * 0.3) * 10.0)
-                net = (layer1 * layer2 * layer3 + 1.0) / 2.0
-
-                depth = (math.sin(ny * 3 + phase * 0.5) + 1.0) / 2.0
-                intensity = max(0.0, min(1.0, net * 0.8 + e * 1.0 + depth * 0.3))
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
-
-                if colors:
-                    color = colors[(idx + int(x * 0.3) + int(y * 0.2)) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # normalized coordinates
+        g = self.geometry
+        nx, ny = g.x / max(1, w), g.y / max(1, h)
+        e = energies[(nx * n).astype(int) % n] if n > 0 else np.zeros_like(nx)
+
+        # multi-layer interference pattern
+        layer1 = np.sin((nx * 6 + phase) * (1.2 + e))
+        layer2 = np.cos((ny * 8 - phase * 0.8) * (1.3 + e * 0.5))
+        layer3 = np.sin((nx + ny + phase * 0.3) * 10.0)
+        net = (layer1 * layer2 * layer3 + 1.0) / 2.0
+
+        depth = (np.sin(ny * 3 + phase * 0.5) + 1.0) / 2.0
+        intensity = np.clip(net * 0.8 + e * 1.0 + depth * 0.3, 0.0, 1.0)
+        idx = (intensity * (nl - 1)).astype(int)
+
+        if colors:
+            tint = g.cached("neuronet.tint", lambda g: (g.x * 0.3).astype(int) + (g.y * 0.2).astype(int))
+            return join_grid(layers[idx], (idx + tint) % len(colors), colors)
+        return join_grid(layers[idx])
@@ -1,7 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
 import math
-import random
+import numpy as np
 
 class PlasmaStormSkin(BaseSkin):
     name = "plasmastorm"
@@ -23,67 +24,66 @@ class PlasmaStormSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        chars = " ░▒▓█"
+        chars = np.array(list(" ░▒▓█"))
         self.time += 0.08
-        
-        avg_energy = sum(norm_energies) / len(norm_energies)
-        
-        # Multiple octaves for fractal noise
+
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        analysis = self.analyze(norm_energies)
+        avg_energy = analysis.mean
+
+        # Multiple octaves for fractal noise. x is a row and y a column, so
+        # every term that depends on only one of them is a 1-D evaluation
         def plasma(x, y, t):
-            value = math.sin(x * 3 + t)
-            value += math.sin(y * 4 + t * 1.3) * 0.7
-            value += math.sin((x + y) * 5 + t * 0.7) * 0.5
-            value += math.sin(math.hypot(x, y) * 6 + t * 1.7) * 0.3
-            
+            value = np.sin(x * 3 + t)
+            value = value + np.sin(y * 4 + t * 1.3) * 0.7
+            # sin((x + y) * 5 + 0.7t) = sin(5x + 0.7t)cos(5y) + cos(5x + 0.7t)sin(5y)
+            value = value + (np.sin(x * 5 + t * 0.7) * np.cos(y * 5) +
+                             np.cos(x * 5 + t * 0.7) * np.sin(y * 5)) * 0.5
+            value = value + np.sin(np.hypot(x, y) * 6 + t * 1.7) * 0.3
+
             # Add audio-influenced turbulence
-            band_x = int(abs(x) * len(norm_energies)) % len(norm_energies)
-            band_y = int(abs(y) * len(norm_energies)) % len(norm_energies)
-            audio_turbulence = (norm_energies[band_x] + norm_energies[band_y]) * 0.4
-            
-            value += math.sin(x * 12 + t * 2) * audio_turbulence * 0.2
-            value += math.cos(y * 10 + t * 1.5) * audio_turbulence * 0.2
-            
-            return (math.sin(value) + 1) / 2
+            band_x = (np.abs(x) * n).astype(int) % n
+            band_y = (np.abs(y) * n).astype(int) % n
+            audio_turbulence = (energies[band_x] + energies[band_y]) * 0.4
+
+            value = value + np.sin(x * 12 + t * 2) * audio_turbulence * 0.2
+            value = value + np.cos(y * 10 + t * 1.5) * audio_turbulence * 0.2
+
+            return (np.sin(value) + 1) / 2
 
         colors = None
         if self.has_color:
-            colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN, 
+            colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN,
                      self.Fore.YELLOW, self.Fore.RED, self.Fore.MAGENTA]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Normalize coordinates with audio-influenced scaling
-                nx = (x / w - 0.5) * (4 + avg_energy * 2)
-                ny = (y / h - 0.5) * (3 + avg_energy * 1.5)
-                
-                # Get plasma value
-                p_val = plasma(nx, ny, self.time)
-                
-                # Add spiral vortex effect
-                angle = math.atan2(ny, nx) + self.time
-                radius = math.hypot(nx, ny)
-                spiral = (math.sin(radius * 8 - angle * 3 + self.time) + 1) / 2
-                
-                # Combine plasma with spiral and audio
-                band_idx = int((angle / (2 * math.pi)) * len(norm_energies)) % len(norm_energies)
-                combined = (p_val * 0.6 + spiral * 0.2 + norm_energies[band_idx] * 0.2)
-                
-                # Pulsing effect from bass frequencies
-                bass_energy = sum(norm_energies[:len(norm_energies)//4]) / max(1, len(norm_energies)//4)
-                pulse = math.sin(self.time * 3 + x * 0.2) * 0.1 * bass_energy
-                final_intensity = min(1.0, max(0.0, combined + pulse))
-                
-                char_idx = min(int(final_intensity * (len(chars) - 1)), len(chars) - 1)
-                ch = chars[char_idx]
-
-                if colors and self.has_color:
-                    # Dynamic color cycling based on position and time
-                    hue = (p_val + self.time * 0.2 + x * 0.05) % 1.0
-                    color_idx = int(hue * (len(colors) - 1))
-                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # Normalize coordinates with audio-influenced scaling
+        g = self.geometry
+        nx = (g.x / w - 0.5) * (4 + avg_energy * 2)
+        ny = (g.y / h - 0.5) * (3 + avg_energy * 1.5)
+
+        # Get plasma value
+        p_val = plasma(nx, ny, self.time)
+
+        # Add spiral vortex effect
+        angle = np.arctan2(ny, nx) + self.time
+        radius = np.hypot(nx, ny)
+        spiral = (np.sin(radius * 8 - angle * 3 + self.time) + 1) / 2
+
+        # Combine plasma with spiral and audio
+        band_idx = (angle / (2 * math.pi) * n).astype(int) % n
+        combined = (p_val * 0.6 + spiral * 0.2 + energies[band_idx] * 0.2)
+
+        # Pulsing effect from bass frequencies
+        bass_energy = analysis.bass
+        pulse = np.sin(self.time * 3 + g.x * 0.2) * 0.1 * bass_energy
+        final_intensity = np.clip(combined + pulse, 0.0, 1.0)
+
+        char_idx = np.minimum((final_intensity * (len(chars) - 1)).astype(int), len(chars) - 1)
+
+        if colors and self.has_color:
+            # Dynamic color cycling based on position and time
+            hue = (p_val + self.time * 0.2 + g.x * 0.05) % 1.0
+            color_idx = (hue * (len(colors) - 1)).astype(int)
+            return join_grid(chars[char_idx], color_idx, colors)
+        return join_grid(chars[char_idx])
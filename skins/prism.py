@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class PrismSkin(BaseSkin):
     name = "prism"
 
@@ -17,14 +20,14 @@ class PrismSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        # safe length check
-        n = len(norm_energies) if hasattr(norm_energies, "__len__") else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         phase = avg * math.pi * 2.0
         freq = 1.5 + avg * 5.0
 
-        layers = " .,-~:;+=*#%@"
+        layers = np.array(list(" .,-~:;+=*#%@"))
         nl = len(layers)
 
         colors = None
@@ -39,28 +42,21 @@ class PrismSkin(BaseSkin):
                 self.Fore.WHITE,
             ]
 
-        screen = []
-        for y in range(h):
-            row_chars = []
-            # slanted offset to create diagonal prism effect
-            slant = (y / max(1, h - 1)) * 2.0 - 1.0
-            for x in range(w):
-                # sample a band safely
-                band = x % n if n > 0 else 0
-                base = norm_energies[band] if n > 0 else 0.0
+        g = self.geometry
+        x, y = g.x, g.y
 
-                # refractive shimmer: combine horizontal wave, vertical slant and per-band energy
-                wave = (math.sin((x / max(1, w)) * freq * math.pi * 2.0 + phase * (0.5 + base)) + 1.0) / 2.0
-                prism = (slant * 0.5 + (y / max(1, h - 1))) * 0.5
-                intensity = max(0.0, min(1.0, base * 0.9 + wave * 0.55 + prism * 0.25))
+        # sample a band per column
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        base = energies[band] if n > 0 else np.zeros(w)
 
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
+        # refractive shimmer: a horizontal wave and per-band energy per column,
+        # a vertical slant (diagonal prism effect) per row
+        wave = (np.sin((x / max(1, w)) * freq * math.pi * 2.0 + phase * (0.5 + base)) + 1.0) / 2.0
+        slant = (y / max(1, h - 1)) * 2.0 - 1.0
+        prism = (slant * 0.5 + (y / max(1, h - 1))) * 0.5
+        intensity = np.clip(base * 0.9 + wave * 0.55 + prism * 0.25, 0.0, 1.0)
 
-                if colors:
-                    color = colors[(idx + x + y) % len(colors)]
-                    row_chars.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row_chars.append(ch)
-            screen.append(''.join(row_chars))
-        return screen
\ No newline at end of file
+        idx = (intensity * (nl - 1)).astype(int)
+        if colors:
+            return join_grid(layers[idx], (idx + np.arange(w) + np.arange(h)[:, np.newaxis]) % len(colors), colors)
+        return join_grid(layers[idx])
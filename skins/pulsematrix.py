@@ -1,5 +1,7 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
 
 class PulseMatrixSkin(BaseSkin):
     name = "pulsematrix"
@@ -17,39 +19,31 @@ class PulseMatrixSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         cx, cy = (w - 1) / 2.0, (h - 1) / 2.0
         phase = avg * math.pi * 6.0
-        layers = " `'.,-~:+*=#%@"
+        layers = np.array(list(" `'.,-~:+*=#%@"))
         nl = len(layers)
 
         colors = None
         if self.has_color:
             colors = [self.Fore.CYAN, self.Fore.GREEN, self.Fore.MAGENTA, self.Fore.YELLOW, self.Fore.WHITE]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                dx, dy = (x - cx) / max(1, cx), (y - cy) / max(1, cy)
-                r = math.hypot(dx, dy)
-                angle = math.atan2(dy, dx)
-
-                # radial pulse and grid overlay
-                pulse = (math.sin(10.0 * r - phase * 2.0) + 1.0) / 2.0
-                grid = (math.sin((x + phase * 2.0) * 0.7) * math.cos((y - phase) * 0.7) + 1.0) / 2.0
-
-                e = norm_energies[int(abs(math.sin(angle) * n)) % n] if n > 0 else 0.0
-                intensity = max(0.0, min(1.0, e * 1.1 + pulse * 0.7 + grid * 0.5 - r * 0.3))
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
-
-                if colors:
-                    color = colors[(idx + int(r * 10)) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        g = self.geometry
+        scale_x, scale_y = max(1, cx), max(1, cy)
+        r = g.polar(cx, cy, scale_x, scale_y).r
+
+        # radial pulse and grid overlay; the grid is a column wave times a row wave
+        pulse = (np.sin(10.0 * r - phase * 2.0) + 1.0) / 2.0
+        grid = (np.sin((g.x + phase * 2.0) * 0.7) * np.cos((g.y - phase) * 0.7) + 1.0) / 2.0
+
+        e = energies[g.angle_bands(n, cx, cy, scale_x, scale_y)] if n > 0 else 0.0
+        intensity = np.clip(e * 1.1 + pulse * 0.7 + grid * 0.5 - r * 0.3, 0.0, 1.0)
+        idx = (intensity * (nl - 1)).astype(int)
+
+        if colors:
+            return join_grid(layers[idx], (idx + (r * 10).astype(int)) % len(colors), colors)
+        return join_grid(layers[idx])
@@ -1,7 +1,9 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
 
 import math
+import numpy as np
 
 class QuantumWaveSkin(BaseSkin):
     name = "quantumwave"
@@ -23,54 +25,51 @@ class QuantumWaveSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        chars = " ▁▂▃▄▅▆▇█"
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        chars = np.array(list(" ▁▂▃▄▅▆▇█"))
         self.time += 0.1
         
-        avg_energy = sum(norm_energies) / len(norm_energies)
+        avg_energy = self.analyze(norm_energies).mean
         quantum_scale = 3.0 + avg_energy * 5.0
         
         colors = None
         if self.has_color:
             colors = [self.Fore.CYAN, self.Fore.BLUE, self.Fore.WHITE, self.Fore.MAGENTA]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Multiple overlapping wave functions
-                nx, ny = x / w, y / h
-                
-                # Wave function 1: Circular standing waves
-                r = math.hypot(nx - 0.5, ny - 0.5) * quantum_scale
-                wave1 = math.sin(r * 4 - self.time * 2) * math.exp(-r * 0.5)
-                
-                # Wave function 2: Interference pattern
-                wave2 = (math.sin(nx * 8 - self.time) * math.sin(ny * 6 + self.time)) * 0.7
-                
-                # Wave function 3: Quantum noise
-                band_idx = (x * y) % len(norm_energies)
-                quantum_noise = norm_energies[band_idx] * math.sin(x * y * 0.1 + self.time)
-                
-                # Combine wave functions
-                wave_sum = (wave1 + wave2 + quantum_noise) / 2.7
-                probability = (math.sin(wave_sum * math.pi) + 1) / 2
-                
-                # "Collapse" the wave function based on audio intensity
-                collapse_threshold = 0.3 + norm_energies[band_idx] * 0.4
-                if probability > collapse_threshold:
-                    intensity = (probability - collapse_threshold) / (1 - collapse_threshold)
-                else:
-                    intensity = 0
-                
-                char_idx = min(int(intensity * (len(chars) - 1)), len(chars) - 1)
-                ch = chars[char_idx]
-                
-                if colors and self.has_color:
-                    # Color based on wave phase and amplitude
-                    phase = (wave_sum + 1) / 2
-                    color_idx = int(phase * (len(colors) - 1))
-                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        g = self.geometry
+        nx, ny = g.x / w, g.y / h
+
+        # Wave function 1: Circular standing waves
+        r = g.field(1.0, 1.0).radius * quantum_scale
+        wave1 = np.sin(r * 4 - self.time * 2) * np.exp(-r * 0.5)
+
+        # Wave function 2: Interference pattern, a column wave times a row wave
+        wave2 = (np.sin(nx * 8 - self.time) * np.sin(ny * 6 + self.time)) * 0.7
+
+        # Wave function 3: Quantum noise. sin(0.1xy + t) is expanded so only
+        # sin/cos of 0.1xy, cached per size, are evaluated over the grid
+        xy = g.product()
+        sin_xy, cos_xy = g.cached("quantumwave.xy", lambda g: (np.sin(xy * 0.1), np.cos(xy * 0.1)))
+        if n > 0:
+            band_energy = energies[g.cached(("quantumwave.bands", n), lambda g: xy % n)]
+        else:
+            band_energy = np.zeros((h, w))
+        quantum_noise = band_energy * (sin_xy * math.cos(self.time) + cos_xy * math.sin(self.time))
+
+        # Combine wave functions
+        wave_sum = (wave1 + wave2 + quantum_noise) / 2.7
+        probability = (np.sin(wave_sum * math.pi) + 1) / 2
+
+        # "Collapse" the wave function based on audio intensity
+        collapse_threshold = 0.3 + band_energy * 0.4
+        intensity = np.where(probability > collapse_threshold,
+                             (probability - collapse_threshold) / (1 - collapse_threshold), 0)
+
+        char_idx = np.minimum((intensity * (len(chars) - 1)).astype(int), len(chars) - 1)
+
+        if colors and self.has_color:
+            # Color based on wave phase and amplitude
+            phase = (wave_sum + 1) / 2
+            return join_grid(chars[char_idx], (phase * (len(colors) - 1)).astype(int), colors)
+        return join_grid(chars[char_idx])
@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 class RainbowSkin(BaseSkin):
     name = "rainbow"
@@ -29,13 +30,12 @@ class RainbowSkin(BaseSkin):
         ]
         screen = []
         for row in range(self.bar_height):
-            line = ""
+            line = []
             for i, h in enumerate(norm_energies):
                 if row >= (self.bar_height - int(h * self.bar_height)):
                     color = rainbow[i % len(rainbow)]
-                    line += color + "@"
+                    line.append((color, "@"))
                 else:
-                    line += " "
-            line += self.Style.RESET_ALL
-            screen.append(line)
+                    line.append((None, " "))
+            screen.append(join_cells(line))
         return screen
@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 class SpectrumRainSkin(BaseSkin):
     name = "spectrumrain"
@@ -37,7 +38,7 @@ class SpectrumRainSkin(BaseSkin):
         # Character intensity levels
         levels = " ▏▎▍▌▋▊▉█"
 
-        screen = [[' '] * w for _ in range(h)]
+        screen = [[(None, ' ')] * w for _ in range(h)]
 
         for x in range(w):
             band_idx = min(x * n // w, n - 1)
@@ -63,8 +64,8 @@ class SpectrumRainSkin(BaseSkin):
                 char_idx = min(int(energy * len(levels)), len(levels) - 1)
                 ch = levels[char_idx]
                 if rainbow:
-                    screen[row][x] = color + ch + self.Style.RESET_ALL
+                    screen[row][x] = (color, ch)
                 else:
-                    screen[row][x] = ch
+                    screen[row][x] = (None, ch)
 
-        return [''.join(row) for row in screen]
\ No newline at end of file
+        return [join_cells(row) for row in screen]
\ No newline at end of file
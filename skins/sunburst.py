@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class SunburstSkin(BaseSkin):
     name = "sunburst"
 
@@ -17,11 +20,12 @@ class SunburstSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         # character ramp from faint to strong
-        ramp = [' ', '.', ':', '-', '=', '+', '*', '#', '@']
+        ramp = np.array([' ', '.', ':', '-', '=', '+', '*', '#', '@'])
         nr = len(ramp)
 
         palette = None
@@ -35,41 +39,28 @@ class SunburstSkin(BaseSkin):
         base_rays = 8
         rays = max(6, int(base_rays + avg * 20))
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                dx = x - cx
-                dy = y - cy
-                r = math.hypot(dx, dy)
-                theta = math.atan2(dy, dx)
-                if theta < 0:
-                    theta += 2 * math.pi
-
-                # determine which ray this angle falls into
-                ray_pos = (theta / (2 * math.pi)) * rays
-                ray_index = int(ray_pos) % rays
-                ray_frac = ray_pos - int(ray_pos)
+        # angle measured from 0 to 2*pi, only recomputed when the size changes
+        r, theta = self.geometry.polar(cx, cy)
+        theta = self.geometry.cached(("sunburst.theta", cx, cy),
+                                     lambda g: np.where(theta < 0, theta + 2 * math.pi, theta))
 
-                # sample band by ray_index to get per-ray energy
-                band = ray_index % n if n > 0 else 0
-                e = norm_energies[band] if n > 0 else 0.0
+        # determine which ray this angle falls into
+        ray_pos = (theta / (2 * math.pi)) * rays
+        ray_index = ray_pos.astype(int) % rays
+        ray_frac = ray_pos - ray_pos.astype(int)
 
-                # radial brightness falls with radius but pulses with energy
-                pulse = 0.5 + 0.5 * math.sin(r * 3.0 - avg * 6.0 + ray_index * 0.6)
-                intensity = max(0.0, min(1.0, (1.0 - (r / (max(1.0, max(cx, cy))))) * (0.6 + e * 0.8) * pulse))
+        # sample band by ray_index to get per-ray energy
+        e = energies[ray_index % n] if n > 0 else 0.0
 
-                # sharpen along ray center
-                center_sharpness = max(0.0, 1.0 - abs(ray_frac - 0.5) * 2.0)
-                intensity = intensity * (0.4 + 0.6 * center_sharpness)
+        # radial brightness falls with radius but pulses with energy
+        pulse = 0.5 + 0.5 * np.sin(r * 3.0 - avg * 6.0 + ray_index * 0.6)
+        intensity = np.clip((1.0 - (r / (max(1.0, max(cx, cy))))) * (0.6 + e * 0.8) * pulse, 0.0, 1.0)
 
-                idx = int(intensity * (nr - 1))
-                ch = ramp[idx]
+        # sharpen along ray center
+        center_sharpness = np.maximum(0.0, 1.0 - np.abs(ray_frac - 0.5) * 2.0)
+        intensity = intensity * (0.4 + 0.6 * center_sharpness)
 
-                if palette:
-                    color = palette[(ray_index + idx) % len(palette)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
+        idx = (intensity * (nr - 1)).astype(int)
+        if palette:
+            return join_grid(ramp[idx], (ray_index + idx) % len(palette), palette)
+        return join_grid(ramp[idx])
@@ -1,5 +1,8 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
+import numpy as np
+
 class TunnelSkin(BaseSkin):
     name = "tunnel"
 
@@ -9,6 +12,15 @@ class TunnelSkin(BaseSkin):
         self.Fore = Fore
         self.Style = Style
 
+    @staticmethod
+    def _depth(g):
+        cx = (g.w - 1) / 2.0
+        cy = (g.h - 1) / 2.0
+        dx = (g.x - cx) / max(1.0, cx)
+        dy = (g.y - cy) / max(1.0, cy)
+        # simulate perspective by using inverse radius
+        return 1.0 / (0.1 + np.hypot(dx, dy))
+
     def render(self, norm_energies):
         import math
 
@@ -17,47 +29,31 @@ class TunnelSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        # safe length check for numpy arrays
-        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
-        avg = (sum(norm_energies) / n) if n > 0 else 0.0
-
-        cx = (w - 1) / 2.0
-        cy = (h - 1) / 2.0
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        avg = self.analyze(norm_energies).mean
 
         # movement and frequency influenced by energy
         phase = avg * math.pi * 2.0
         freq = 2.0 + avg * 6.0
 
-        layers = " .,:;iIl!TfLJYXW#@"
+        layers = np.array(list(" .,:;iIl!TfLJYXW#@"))
         nl = len(layers)
 
         colors = None
         if self.has_color:
             colors = [self.Fore.MAGENTA, self.Fore.CYAN, self.Fore.YELLOW, self.Fore.GREEN, self.Fore.RED]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                dx = (x - cx) / max(1.0, cx)
-                dy = (y - cy) / max(1.0, cy)
-                r = math.hypot(dx, dy)
-
-                # simulate perspective by using inverse radius and a moving phase
-                depth = (1.0 / (0.1 + r))
-                ring = (math.sin(depth * freq + phase) + 1.0) / 2.0
-
-                # sample a band to modulate intensity (safe with n)
-                band = x % n if n > 0 else 0
-                intensity = min(1.0, (norm_energies[band] if n > 0 else 0.0) * 1.5 + ring * 0.5)
-
-                idx = int(intensity * (nl - 1))
-                ch = layers[idx]
-
-                if colors:
-                    color = colors[(idx + band) % len(colors)]
-                    row.append(color + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
+        g = self.geometry
+        depth = g.cached("tunnel.depth", self._depth)
+        ring = (np.sin(depth * freq + phase) + 1.0) / 2.0
+
+        # sample a band per column to modulate intensity
+        band = np.arange(w) % n if n > 0 else np.zeros(w, dtype=int)
+        e = energies[band] if n > 0 else np.zeros(w)
+        intensity = np.minimum(1.0, e * 1.5 + ring * 0.5)
+
+        idx = (intensity * (nl - 1)).astype(int)
+        if colors:
+            return join_grid(layers[idx], (idx + band) % len(colors), colors)
+        return join_grid(layers[idx])
@@ -1,7 +1,9 @@
 from .base import BaseSkin
+from core.display import join_grid
 from colorama import Fore, Style
 
 import math
+import numpy as np
 
 class VortexSkin(BaseSkin):
     name = "vortex"
@@ -22,10 +24,12 @@ class VortexSkin(BaseSkin):
         if w <= 0 or h <= 0:
             return []
 
-        chars = " ░▒▓█"
+        energies = np.asarray(norm_energies, dtype=np.float64)
+        n = energies.size
+        chars = np.array(list(" ░▒▓█"))
         center_x, center_y = w / 2, h / 2
         max_radius = min(center_x, center_y)
-        avg_energy = sum(norm_energies) / len(norm_energies)
+        avg_energy = self.analyze(norm_energies).mean
         
         # Dynamic spiral parameters based on audio
         spiral_tightness = 2.0 + avg_energy * 3.0
@@ -35,31 +39,22 @@ class VortexSkin(BaseSkin):
         if self.has_color:
             colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.MAGENTA, self.Fore.WHITE]
 
-        screen = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Convert to polar coordinates
-                dx, dy = x - center_x, y - center_y
-                radius = math.hypot(dx, dy) / max_radius
-                angle = math.atan2(dy, dx) + phase_shift
-                
-                # Create spiral pattern
-                spiral_value = (angle % (2 * math.pi)) + radius * spiral_tightness
-                spiral_wave = (math.sin(spiral_value) + 1) / 2
-                
-                # Modulate with audio energy
-                band_idx = int((angle / (2 * math.pi)) * len(norm_energies)) % len(norm_energies)
-                energy = norm_energies[band_idx]
-                combined = (spiral_wave * 0.7 + energy * 0.3)
-                
-                char_idx = min(int(combined * (len(chars) - 1)), len(chars) - 1)
-                ch = chars[char_idx]
-                
-                if colors and self.has_color:
-                    color_idx = int((angle / (2 * math.pi)) * len(colors)) % len(colors)
-                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
-                else:
-                    row.append(ch)
-            screen.append(''.join(row))
-        return screen
\ No newline at end of file
+        # Polar coordinates, rotated by the audio
+        polar = self.geometry.polar(center_x, center_y)
+        radius = polar.r / max_radius
+        angle = polar.theta + phase_shift
+
+        # Create spiral pattern
+        spiral_value = (angle % (2 * math.pi)) + radius * spiral_tightness
+        spiral_wave = (np.sin(spiral_value) + 1) / 2
+
+        # Modulate with audio energy
+        turns = angle / (2 * math.pi)
+        energy = energies[(turns * n).astype(int) % n] if n > 0 else 0.0
+        combined = (spiral_wave * 0.7 + energy * 0.3)
+
+        char_idx = np.minimum((combined * (len(chars) - 1)).astype(int), len(chars) - 1)
+
+        if colors and self.has_color:
+            return join_grid(chars[char_idx], (turns * len(colors)).astype(int) % len(colors), colors)
+        return join_grid(chars[char_idx])
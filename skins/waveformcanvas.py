@@ -1,4 +1,5 @@
 from .base import BaseSkin
+from core.display import join_cells
 from colorama import Fore, Style
 import math
 
@@ -40,7 +41,7 @@ class WaveformCanvasSkin(BaseSkin):
         mid = h // 2
 
         # Build empty frame
-        screen = [[' '] * w for _ in range(h)]
+        screen = [[(None, ' ')] * w for _ in range(h)]
 
         for x in range(w):
             amp = sampled[x]
@@ -53,6 +54,7 @@ class WaveformCanvasSkin(BaseSkin):
             ch = chars[char_idx]
 
             # Color: blue → cyan → yellow → red
+            color = None
             if self.has_color:
                 hue = min(1.0, amp * 1.5)
                 if hue < 0.33:
@@ -63,18 +65,17 @@ class WaveformCanvasSkin(BaseSkin):
                     color = self.Fore.YELLOW
                 else:
                     color = self.Fore.RED
-                ch = color + ch + self.Style.RESET_ALL
 
             # Draw at center ± height
             y_top = max(0, mid - height)
             y_bottom = min(h - 1, mid + height)
-            screen[y_top][x] = ch
+            screen[y_top][x] = (color, ch)
             if y_bottom != y_top:
-                screen[y_bottom][x] = ch
+                screen[y_bottom][x] = (color, ch)
 
             # Optional: fill center for stronger signals
             if amp > 0.5:
                 for y in range(y_top + 1, y_bottom):
-                    screen[y][x] = ch if not self.has_color else color + "▄" + self.Style.RESET_ALL
+                    screen[y][x] = (None, ch) if not self.has_color else (color, "▄")
 
-        return [''.join(row) for row in screen]
\ No newline at end of file
+        return [join_cells(row) for row in screen]
\ No newline at end of file
@@ -0,0 +1,851 @@
+"""Per-cell reference versions of the vectorized skins.
+
+Each class is the skin's render loop as it was before the skin moved to
+array operations, kept verbatim so the parity tests can check that the
+array version still draws the same cells.
+"""
+import math
+import random
+
+from colorama import Fore, Style
+
+from skins.base import BaseSkin
+
+
+class TunnelSkin(BaseSkin):
+    name = "tunnel"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        self.has_color = True
+        self.Fore = Fore
+        self.Style = Style
+
+    def render(self, norm_energies):
+        import math
+
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        # safe length check for numpy arrays
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+
+        cx = (w - 1) / 2.0
+        cy = (h - 1) / 2.0
+
+        # movement and frequency influenced by energy
+        phase = avg * math.pi * 2.0
+        freq = 2.0 + avg * 6.0
+
+        layers = " .,:;iIl!TfLJYXW#@"
+        nl = len(layers)
+
+        colors = None
+        if self.has_color:
+            colors = [self.Fore.MAGENTA, self.Fore.CYAN, self.Fore.YELLOW, self.Fore.GREEN, self.Fore.RED]
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                dx = (x - cx) / max(1.0, cx)
+                dy = (y - cy) / max(1.0, cy)
+                r = math.hypot(dx, dy)
+
+                # simulate perspective by using inverse radius and a moving phase
+                depth = (1.0 / (0.1 + r))
+                ring = (math.sin(depth * freq + phase) + 1.0) / 2.0
+
+                # sample a band to modulate intensity (safe with n)
+                band = x % n if n > 0 else 0
+                intensity = min(1.0, (norm_energies[band] if n > 0 else 0.0) * 1.5 + ring * 0.5)
+
+                idx = int(intensity * (nl - 1))
+                ch = layers[idx]
+
+                if colors:
+                    color = colors[(idx + band) % len(colors)]
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class HexGridSkin(BaseSkin):
+    name = "hexgrid"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        self.has_color = True
+        self.Fore = Fore
+        self.Style = Style
+
+    def render(self, norm_energies):
+        import math
+
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+
+        # characters approximating hex cells (alternating rows shifted)
+        cells = [' ', '·', '○', '●', '◆', '■']
+        nc = len(cells)
+
+        palette = None
+        if self.has_color:
+            palette = [self.Fore.CYAN, self.Fore.MAGENTA, self.Fore.YELLOW, self.Fore.GREEN, self.Fore.RED]
+
+        # spacing factors to make 'hex' look good in monospace
+        x_scale = 1.0
+        y_scale = 0.5
+
+        screen = []
+        for row in range(h):
+            line = []
+            for col in range(w):
+                # axial-like coordinates: shift every other row
+                sx = col + (0.5 if row % 2 == 0 else 0.0)
+                sy = row * (1.0 / y_scale)
+
+                # distance from a moving center that reacts to avg energy
+                cx = (w - 1) / 2.0 + math.sin(avg * 2.0 * math.pi) * (w * 0.05)
+                cy = (h - 1) / 2.0
+
+                dx = (sx - cx) * x_scale
+                dy = (sy - cy) * y_scale
+                r = math.hypot(dx, dy)
+
+                # sample a band to modulate the cell (wrap if needed)
+                band = col % n if n > 0 else 0
+                e = norm_energies[band] if n > 0 else 0.0
+
+                # rhythmic ring effect plus per-band pulse
+                ring = 0.5 + 0.5 * math.sin(r * 1.5 - avg * 6.0 + col * 0.1)
+                intensity = max(0.0, min(1.0, ring * (0.6 + e * 0.8)))
+
+                idx = int(intensity * (nc - 1))
+                ch = cells[idx]
+
+                if palette:
+                    color = palette[(idx + band) % len(palette)]
+                    line.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    line.append(ch)
+            screen.append(''.join(line))
+        return screen
+
+
+class NeuroNetSkin(BaseSkin):
+    name = "neuronet"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        self.has_color = True
+        self.Fore = Fore
+        self.Style = Style
+
+    def render(self, norm_energies):
+        import math, random
+
+        w, h = self.num_bands, self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+
+        phase = avg * math.pi * 8.0
+        layers = " .`'~-^:+*xX#%@"
+        nl = len(layers)
+
+        colors = None
+        if self.has_color:
+            colors = [
+                self.Fore.BLUE,
+                self.Fore.CYAN,
+                self.Fore.GREEN,
+                self.Fore.MAGENTA,
+                self.Fore.YELLOW,
+            ]
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # normalized coordinates
+                nx, ny = x / max(1, w), y / max(1, h)
+                e = norm_energies[int(nx * n) % n] if n > 0 else 0.0
+
+                # multi-layer interference pattern
+                layer1 = math.sin((nx * 6 + phase) * (1.2 + e))
+                layer2 = math.cos((ny * 8 - phase * 0.8) * (1.3 + e * 0.5))
+                layer3 = math.sin((nx + ny + phase * 0.3) * 10.0)
+                net = (layer1 * layer2 * layer3 + 1.0) / 2.0
+
+                depth = (math.sin(ny * 3 + phase * 0.5) + 1.0) / 2.0
+                intensity = max(0.0, min(1.0, net * 0.8 + e * 1.0 + depth * 0.3))
+                idx = int(intensity * (nl - 1))
+                ch = layers[idx]
+
+                if colors:
+                    color = colors[(idx + int(x * 0.3) + int(y * 0.2)) % len(colors)]
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class MoireFieldSkin(BaseSkin):
+    name = "moirefield"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+        except ImportError:
+            self.has_color = False
+        self.phase = 0.0
+
+    def render(self, norm_energies):
+        w, h = self.num_bands, self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        if n == 0:
+            norm_energies = [0.5] * w
+            n = w
+
+        # Split spectrum: low = global scale, high = local noise
+        low_avg = sum(norm_energies[:max(1, n // 4)]) / max(1, n // 4)
+        high_avg = sum(norm_energies[-max(1, n // 4):]) / max(1, n // 4)
+
+        self.phase += 0.03 + low_avg * 0.05
+
+        chars = " .:-=+*#%@"
+        colors = [self.Fore.GREEN, self.Fore.YELLOW, self.Fore.RED] if self.has_color else None
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # Normalized coords
+                u = x / max(1, w - 1)
+                v = y / max(1, h - 1)
+
+                # Base moiré: two rotating grids
+                freq1 = 8.0 + low_avg * 12.0
+                freq2 = 6.0 + low_avg * 10.0
+                angle1 = self.phase
+                angle2 = -self.phase + 0.3
+
+                # Grid 1
+                x1 = u * math.cos(angle1) - v * math.sin(angle1)
+                y1 = u * math.sin(angle1) + v * math.cos(angle1)
+                pattern1 = math.sin(x1 * freq1) * math.sin(y1 * freq1)
+
+                # Grid 2
+                x2 = u * math.cos(angle2) - v * math.sin(angle2)
+                y2 = u * math.sin(angle2) + v * math.cos(angle2)
+                pattern2 = math.sin(x2 * freq2) * math.sin(y2 * freq2)
+
+                # Interference
+                moire = (pattern1 + pattern2) / 2.0
+
+                # Local perturbation from high frequencies
+                band_idx = (x + y) % n
+                noise = (norm_energies[band_idx] - 0.5) * 2.0
+                moire += noise * high_avg * 0.5
+
+                intensity = (moire + 1.0) / 2.0
+                intensity = max(0.0, min(1.0, intensity))
+
+                idx = int(intensity * (len(chars) - 1))
+                ch = chars[idx]
+
+                if colors:
+                    color_idx = int(u * len(colors)) % len(colors)
+                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class PlasmaStormSkin(BaseSkin):
+    name = "plasmastorm"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+        except ImportError:
+            self.has_color = False
+        self.time = 0
+
+    def render(self, norm_energies):
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        chars = " ░▒▓█"
+        self.time += 0.08
+        
+        avg_energy = sum(norm_energies) / len(norm_energies)
+        
+        # Multiple octaves for fractal noise
+        def plasma(x, y, t):
+            value = math.sin(x * 3 + t)
+            value += math.sin(y * 4 + t * 1.3) * 0.7
+            value += math.sin((x + y) * 5 + t * 0.7) * 0.5
+            value += math.sin(math.hypot(x, y) * 6 + t * 1.7) * 0.3
+            
+            # Add audio-influenced turbulence
+            band_x = int(abs(x) * len(norm_energies)) % len(norm_energies)
+            band_y = int(abs(y) * len(norm_energies)) % len(norm_energies)
+            audio_turbulence = (norm_energies[band_x] + norm_energies[band_y]) * 0.4
+            
+            value += math.sin(x * 12 + t * 2) * audio_turbulence * 0.2
+            value += math.cos(y * 10 + t * 1.5) * audio_turbulence * 0.2
+            
+            return (math.sin(value) + 1) / 2
+
+        colors = None
+        if self.has_color:
+            colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.GREEN, 
+                     self.Fore.YELLOW, self.Fore.RED, self.Fore.MAGENTA]
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # Normalize coordinates with audio-influenced scaling
+                nx = (x / w - 0.5) * (4 + avg_energy * 2)
+                ny = (y / h - 0.5) * (3 + avg_energy * 1.5)
+                
+                # Get plasma value
+                p_val = plasma(nx, ny, self.time)
+                
+                # Add spiral vortex effect
+                angle = math.atan2(ny, nx) + self.time
+                radius = math.hypot(nx, ny)
+                spiral = (math.sin(radius * 8 - angle * 3 + self.time) + 1) / 2
+                
+                # Combine plasma with spiral and audio
+                band_idx = int((angle / (2 * math.pi)) * len(norm_energies)) % len(norm_energies)
+                combined = (p_val * 0.6 + spiral * 0.2 + norm_energies[band_idx] * 0.2)
+                
+                # Pulsing effect from bass frequencies
+                bass_energy = sum(norm_energies[:len(norm_energies)//4]) / max(1, len(norm_energies)//4)
+                pulse = math.sin(self.time * 3 + x * 0.2) * 0.1 * bass_energy
+                final_intensity = min(1.0, max(0.0, combined + pulse))
+                
+                char_idx = min(int(final_intensity * (len(chars) - 1)), len(chars) - 1)
+                ch = chars[char_idx]
+
+                if colors and self.has_color:
+                    # Dynamic color cycling based on position and time
+                    hue = (p_val + self.time * 0.2 + x * 0.05) % 1.0
+                    color_idx = int(hue * (len(colors) - 1))
+                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class HarmonicFieldSkin(BaseSkin):
+    name = "harmonicfield"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+            from colorama import Fore, Style, Back
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+            self.Back = Back
+        except ImportError:
+            self.has_color = False
+        self.time = 0
+        self.phase_history = []
+
+    def render(self, norm_energies):
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        chars = " ░▒▓█"
+        self.time += 0.06
+        
+        # Spectral analysis
+        spectral_centroid = sum(i * energy for i, energy in enumerate(norm_energies)) / sum(norm_energies) if sum(norm_energies) > 0 else 0
+        brightness = sum(norm_energies[len(norm_energies)//2:]) / max(1, len(norm_energies)//2)
+        warmth = sum(norm_energies[:len(norm_energies)//3]) / max(1, len(norm_energies)//3)
+        
+        colors = None
+        if self.has_color:
+            # Color meaning: Warmth=Red/Orange, Brightness=Cyan/Blue, Complexity=Purple, Richness=White
+            colors = {
+                'warm': [self.Fore.RED, self.Fore.YELLOW, self.Fore.MAGENTA],
+                'bright': [self.Fore.CYAN, self.Fore.BLUE, self.Fore.WHITE],
+                'complex': [self.Fore.MAGENTA, self.Fore.GREEN, self.Fore.CYAN],
+                'rich': [self.Fore.WHITE, self.Fore.YELLOW, self.Fore.CYAN]
+            }
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # 3D spherical coordinates
+                nx = (x / w - 0.5) * 2.0
+                ny = (y / h - 0.5) * 1.5
+                
+                # Convert to spherical for 3D effect
+                theta = math.atan2(ny, nx)
+                phi = math.hypot(nx, ny) * math.pi
+                r = math.hypot(nx, ny)
+                
+                # Harmonic series influenced by spectral centroid
+                base_freq = 2.0 + spectral_centroid / len(norm_energies) * 8.0
+                harmonics = 0.0
+                
+                # Generate harmonic overtones
+                for overtone in range(1, 6):  # 5 harmonics
+                    harmonic_gain = norm_energies[min(overtone * 2, len(norm_energies)-1)]
+                    phase = self.time * (0.5 + overtone * 0.3)
+                    harmonics += (math.sin(theta * base_freq * overtone + phase) * 
+                                math.cos(phi * base_freq * overtone * 0.7 + phase) * 
+                                harmonic_gain / overtone)
+                
+                # Main carrier wave with audio modulation
+                carrier = math.sin(theta * base_freq * 3 + self.time * 2) * math.cos(phi * base_freq * 2)
+                
+                # Combine with harmonics
+                combined = (carrier * (0.6 + warmth * 0.3) + harmonics * (0.4 + brightness * 0.3))
+                
+                # Add amplitude modulation from bass
+                am_depth = warmth * 0.5
+                am_wave = (1.0 - am_depth) + am_depth * math.sin(self.time * 3 + r * 8)
+                modulated = combined * am_wave
+                
+                # 3D depth effect - closer objects are brighter
+                depth_factor = 1.0 / (1.0 + r * 2.0)
+                final_intensity = (modulated + 1.0) / 2.0 * depth_factor
+                final_intensity = min(1.0, final_intensity * (1.2 + brightness * 0.3))
+                
+                char_idx = min(int(final_intensity * (len(chars) - 1)), len(chars) - 1)
+                ch = chars[char_idx]
+                
+                if colors and self.has_color:
+                    # Determine sound quality for color selection
+                    if warmth > 0.6 and brightness < 0.3:
+                        palette = colors['warm']  # Warm, bass-heavy
+                        color_idx = int((r + self.time) * 2) % len(palette)
+                    elif brightness > 0.5 and warmth < 0.4:
+                        palette = colors['bright']  # Bright, treble-heavy
+                        color_idx = int((theta + self.time) * 3) % len(palette)
+                    elif spectral_centroid > len(norm_energies) * 0.6 and len(set(norm_energies)) > 10:
+                        palette = colors['complex']  # Complex, wide spectrum
+                        color_idx = int((phi + self.time) * 2) % len(palette)
+                    else:
+                        palette = colors['rich']  # Balanced, rich sound
+                        color_idx = int((r + theta + self.time) * 1.5) % len(palette)
+                    
+                    row.append(palette[color_idx] + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class CymaticSkin(BaseSkin):
+    name = "cymatic"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+            from colorama import init, Fore, Style, Back
+            init(autoreset=True)
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+            self.Back = Back
+        except ImportError:
+            self.has_color = False
+        self.time = 0
+        self.sand_memory = []  # Store previous frames for persistence
+
+    def render(self, norm_energies):
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        chars = " .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
+        self.time += 0.05
+        
+        # Analyze frequency characteristics
+        bass = sum(norm_energies[:len(norm_energies)//4]) / max(1, len(norm_energies)//4)
+        mids = sum(norm_energies[len(norm_energies)//4:3*len(norm_energies)//4]) / max(1, len(norm_energies)//2)
+        highs = sum(norm_energies[3*len(norm_energies)//4:]) / max(1, len(norm_energies)//4)
+        avg_energy = (bass + mids + highs) / 3
+
+        # Initialize sand canvas with persistence
+        if not self.sand_memory:
+            self.sand_memory = [[0.0 for _ in range(w)] for _ in range(h)]
+        
+        colors = None
+        if self.has_color:
+            # Color meaning: Bass=Red, Mids=Green, Highs=Blue, Mixed=White/Yellow
+            colors = {
+                'bass': self.Fore.RED + self.Back.BLACK,
+                'mids': self.Fore.GREEN + self.Back.BLACK, 
+                'highs': self.Fore.BLUE + self.Back.BLACK,
+                'full': self.Fore.YELLOW + self.Back.BLACK,
+                'rich': self.Fore.WHITE + self.Back.BLACK
+            }
+
+        screen = []
+        new_sand = [[0.0 for _ in range(w)] for _ in range(h)]
+        
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # Normalize coordinates to 3D space
+                nx = (x / w - 0.5) * 4.0
+                ny = (y / h - 0.5) * 3.0
+                
+                # Multiple resonant frequencies (like Chladni plates)
+                freq1 = 3.0 + bass * 5.0  # Bass controls base frequency
+                freq2 = 7.0 + mids * 8.0   # Mids control complexity
+                freq3 = 12.0 + highs * 15.0 # Highs add fine details
+                
+                # Standing wave patterns
+                wave1 = math.sin(nx * freq1 + self.time) * math.cos(ny * freq1)
+                wave2 = math.sin(nx * freq2 * 1.3) * math.cos(ny * freq2 * 0.7 + self.time * 1.5)
+                wave3 = math.sin((nx + ny) * freq3 + self.time * 2) * math.cos((nx - ny) * freq3)
+                
+                # Combine waves with audio modulation
+                combined_wave = (wave1 * (0.4 + bass * 0.3) + 
+                               wave2 * (0.3 + mids * 0.2) + 
+                               wave3 * (0.2 + highs * 0.1))
+                
+                # Add circular nodal patterns
+                radius = math.hypot(nx, ny)
+                circular_wave = math.sin(radius * (8.0 + avg_energy * 6.0) - self.time * 2)
+                final_wave = (combined_wave + circular_wave * 0.4) / 1.4
+                
+                # Sand-like persistence (accumulate and fade)
+                persistence = 0.7
+                new_value = abs(final_wave) * (0.8 + avg_energy * 0.4)
+                sand_value = max(new_value, self.sand_memory[y][x] * persistence)
+                new_sand[y][x] = sand_value
+                
+                # Convert to character with depth perception
+                depth_intensity = sand_value * (0.9 + 0.3 * math.sin(radius * 2))
+                char_idx = min(int(depth_intensity * (len(chars) - 1)), len(chars) - 1)
+                ch = chars[char_idx]
+                
+                if colors and self.has_color:
+                    # Color coding based on frequency dominance and intensity
+                    if bass > 0.6 and sand_value > 0.5:
+                        color = colors['bass']  # Strong bass = Red
+                    elif mids > 0.5 and sand_value > 0.4:
+                        color = colors['mids']  # Prominent mids = Green
+                    elif highs > 0.4 and sand_value > 0.3:
+                        color = colors['highs'] # Crisp highs = Blue
+                    elif bass > 0.4 and mids > 0.4 and highs > 0.3:
+                        color = colors['rich']  # Full spectrum = White
+                    else:
+                        color = colors['full']  # Mixed frequencies = Yellow
+                    
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        
+        self.sand_memory = new_sand
+        return screen
+
+
+class HexWarpSkin(BaseSkin):
+    name = "hexwarp"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+        except ImportError:
+            self.has_color = False
+
+    def render(self, norm_energies):
+        import math
+
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, "__len__") else 0
+        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+
+        phase = avg * math.pi * 2.0
+        freq = 1.8 + avg * 4.0
+
+        layers = " .·oO0@#"
+        nl = len(layers)
+
+        colors = None
+        if self.has_color:
+            colors = [self.Fore.CYAN, self.Fore.GREEN, self.Fore.YELLOW, self.Fore.MAGENTA, self.Fore.RED]
+
+        cx = (w - 1) / 2.0
+        cy = (h - 1) / 2.0
+
+        screen = []
+        for y in range(h):
+            row = []
+            # stagger for "hex" look: every other row offsets the warp pattern
+            row_offset = 0.5 if (y % 2) == 1 else 0.0
+            for x in range(w):
+                # compute a geometric warp field
+                x_norm = (x + row_offset - cx) / max(1.0, cx)
+                y_norm = (y - cy) / max(1.0, cy)
+                r = math.hypot(x_norm, y_norm)
+
+                # sample band safely (use x as band index)
+                band = x % n if n > 0 else 0
+                energy = norm_energies[band] if n > 0 else 0.0
+
+                # warp combines radial ripples and diagonal shear for hex effect
+                ripple = (math.sin(r * (freq * 3.0) - phase * (0.5 + energy)) + 1.0) / 2.0
+                shear = (math.sin((x + y) * 0.3 + phase * 0.7) + 1.0) / 2.0
+
+                intensity = max(0.0, min(1.0, energy * 0.85 + ripple * 0.6 + shear * 0.25 - r * 0.2))
+
+                idx = int(intensity * (nl - 1))
+                ch = layers[idx]
+
+                if colors:
+                    color = colors[(idx + band + y) % len(colors)]
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class DiamondWaveSkin(BaseSkin):
+    name = "diamondwave"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        self.has_color = True
+        self.Fore = Fore
+        self.Style = Style
+
+    def render(self, norm_energies):
+        import math
+
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        avg = (sum(norm_energies) / n) if n > 0 else 0.0
+
+        # diamond characters (outline -> filled)
+        diamonds = [' ', '.', '*', 'o', 'O', '#']
+        nd = len(diamonds)
+
+        palette = None
+        if self.has_color:
+            palette = [self.Fore.CYAN, self.Fore.MAGENTA, self.Fore.YELLOW, self.Fore.GREEN, self.Fore.RED]
+
+        screen = []
+        cx = (w - 1) / 2.0
+        cy = (h - 1) / 2.0
+
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # build a diamond lattice using manhattan-like metric rotated
+                rx = (x - cx) / max(1.0, cx)
+                ry = (y - cy) / max(1.0, cy)
+                d = abs(rx) + abs(ry)
+
+                # per-column band modulation
+                band = x % n if n > 0 else 0
+                e = norm_energies[band] if n > 0 else 0.0
+
+                # wave ripple that depends on distance and average energy
+                ripple = 0.5 + 0.5 * math.sin(d * 8.0 - avg * 10.0 + band * 0.3)
+
+                intensity = max(0.0, min(1.0, ripple * (0.5 + e * 0.8)))
+                idx = int(intensity * (nd - 1))
+                ch = diamonds[idx]
+
+                if palette:
+                    color = palette[(idx + band) % len(palette)]
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class FractalLatticeSkin(BaseSkin):
+    name = "fractallattice"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+        except ImportError:
+            self.has_color = False
+        self.iteration = 0
+
+    def _sierpinski(self, x, y, depth, energy):
+        if depth == 0:
+            return 1
+        step = 2 ** depth
+        if (x // step) % 2 == 1 and (y // step) % 2 == 1:
+            return 0
+        return self._sierpinski(x, y, depth - 1, energy)
+
+    def render(self, norm_energies):
+        w, h = self.num_bands, self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        n = len(norm_energies) if hasattr(norm_energies, '__len__') else 0
+        if n == 0:
+            norm_energies = [0.0] * w
+            n = w
+
+        # Dynamic recursion depth based on avg energy
+        avg = sum(norm_energies) / n if n > 0 else 0.0
+        max_depth = max(1, min(5, int(avg * 4) + 1))
+
+        chars = " ▄▀█"
+        colors = [self.Fore.BLUE, self.Fore.CYAN, self.Fore.WHITE] if self.has_color else None
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                band = x % n
+                energy = norm_energies[band]
+                # Modulate fractal presence by local energy
+                if energy < 0.1:
+                    ch = " "
+                else:
+                    val = self._sierpinski(x, y, max_depth, energy)
+                    idx = int(val * (len(chars) - 1))
+                    ch = chars[idx]
+
+                if colors:
+                    color = colors[(x + y + int(energy * 10)) % len(colors)]
+                    row.append(color + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
+
+
+class QuantumWaveSkin(BaseSkin):
+    name = "quantumwave"
+
+    def __init__(self, bar_height, num_bands):
+        super().__init__(bar_height, num_bands)
+        try:
+
+            self.has_color = True
+            self.Fore = Fore
+            self.Style = Style
+        except ImportError:
+            self.has_color = False
+        self.time = 0
+
+    def render(self, norm_energies):
+        w = self.num_bands
+        h = self.bar_height
+        if w <= 0 or h <= 0:
+            return []
+
+        chars = " ▁▂▃▄▅▆▇█"
+        self.time += 0.1
+        
+        avg_energy = sum(norm_energies) / len(norm_energies)
+        quantum_scale = 3.0 + avg_energy * 5.0
+        
+        colors = None
+        if self.has_color:
+            colors = [self.Fore.CYAN, self.Fore.BLUE, self.Fore.WHITE, self.Fore.MAGENTA]
+
+        screen = []
+        for y in range(h):
+            row = []
+            for x in range(w):
+                # Multiple overlapping wave functions
+                nx, ny = x / w, y / h
+                
+                # Wave function 1: Circular standing waves
+                r = math.hypot(nx - 0.5, ny - 0.5) * quantum_scale
+                wave1 = math.sin(r * 4 - self.time * 2) * math.exp(-r * 0.5)
+                
+                # Wave function 2: Interference pattern
+                wave2 = (math.sin(nx * 8 - self.time) * math.sin(ny * 6 + self.time)) * 0.7
+                
+                # Wave function 3: Quantum noise
+                band_idx = (x * y) % len(norm_energies)
+                quantum_noise = norm_energies[band_idx] * math.sin(x * y * 0.1 + self.time)
+                
+                # Combine wave functions
+                wave_sum = (wave1 + wave2 + quantum_noise) / 2.7
+                probability = (math.sin(wave_sum * math.pi) + 1) / 2
+                
+                # "Collapse" the wave function based on audio intensity
+                collapse_threshold = 0.3 + norm_energies[band_idx] * 0.4
+                if probability > collapse_threshold:
+                    intensity = (probability - collapse_threshold) / (1 - collapse_threshold)
+                else:
+                    intensity = 0
+                
+                char_idx = min(int(intensity * (len(chars) - 1)), len(chars) - 1)
+                ch = chars[char_idx]
+                
+                if colors and self.has_color:
+                    # Color based on wave phase and amplitude
+                    phase = (wave_sum + 1) / 2
+                    color_idx = int(phase * (len(colors) - 1))
+                    row.append(colors[color_idx] + ch + self.Style.RESET_ALL)
+                else:
+                    row.append(ch)
+            screen.append(''.join(row))
+        return screen
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from core.analysis import Analysis, Spectrum, analyze
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 37, 78, 298])
+def test_averages_match_python_sums(n):
+    # skins used to compute these with sum(); results must agree to the last bit
+    rng = np.random.default_rng(n)
+    for _ in range(50):
+        energies = rng.random(n)
+        values = list(energies)
+        a = Analysis(energies)
+        assert a.mean == sum(values) / n
+        assert a.bass == sum(values[:n // 4]) / max(1, n // 4)
+        assert a.mid == sum(values[n // 4:3 * n // 4]) / max(1, n // 2)
+        assert a.high == sum(values[-n // 4:]) / max(1, n // 4)
+        assert a.spread == np.mean(np.abs(energies - np.mean(energies)))
+
+
+def test_empty_spectrum():
+    a = Analysis([])
+    assert a.mean == a.peak == a.spread == a.bass == a.high == 0.0
+    assert a.coarse(8).tolist() == [0.0] * 8
+
+
+def test_spectrum_carries_its_analysis():
+    spectrum = Spectrum(np.linspace(0.0, 1.0, 40))
+    assert analyze(spectrum) is spectrum.analysis
+    assert spectrum[:10].analysis is None
+    np.testing.assert_allclose(spectrum.analysis.coarse(8), np.linspace(0.0, 1.0, 40).reshape(8, 5).mean(axis=1))
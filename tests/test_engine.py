@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from core.engine import AudioEngine
+
+
+def loop_reduce(engine, fft):
+    # the per-band loop process() used before the cumulative-sum reducer
+    return np.array([np.mean(fft[band]) for band in engine.bands])
+
+
+@pytest.mark.parametrize("num_bands", [8, 37, 78, 298, 500])
+@pytest.mark.parametrize("window_size", [None, 256, 1024, 4096])
+@pytest.mark.parametrize("split_freq", [150.0, 300.0, 1000.0])
+def test_reduce_bands_matches_loop(num_bands, window_size, split_freq):
+    engine = AudioEngine(num_bands, window_size=window_size, split_freq=split_freq)
+    rng = np.random.default_rng(num_bands)
+    samples = (rng.standard_normal(engine.chunk) * 3000).astype(np.float32)
+    fft = np.abs(np.fft.rfft(samples * engine.window))
+    np.testing.assert_allclose(engine._reduce_bands(fft), loop_reduce(engine, fft), rtol=1e-6)
+
+
+def test_balance_gain_uses_band_centres():
+    engine = AudioEngine(64)
+    centres = loop_reduce(engine, engine.freqs)
+    with np.errstate(divide="ignore"):
+        expected = np.clip(engine.balance_gain_factor / np.sqrt(centres), 1.0, 12.0)
+    np.testing.assert_allclose(engine.balance_gain, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("hop_size", [0, -1, 257])
+def test_rejects_hop_outside_window(hop_size):
+    with pytest.raises(ValueError):
+        AudioEngine(64, window_size=256, hop_size=hop_size)
+
+
+@pytest.mark.parametrize("window_size", [0, -8])
+def test_rejects_window_size_below_one(window_size):
+    with pytest.raises(ValueError, match="window size"):
+        AudioEngine(64, window_size=window_size)
+
+
+def test_hop_defaults_to_window():
+    engine = AudioEngine(64, window_size=512)
+    assert engine.hop == engine.chunk == 512
+    assert AudioEngine(64, window_size=512, hop_size=512).hop == 512
@@ -0,0 +1,89 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from core.engine import AudioEngine
+from core.offline import WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_PCM, load_audio, render_offline
+from skins import SKINS
+
+RATE = 44100
+
+
+def wav(tag, bits, payload, channels=2, extensible=False):
+    block = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", WAVE_FORMAT_EXTENSIBLE if extensible else tag,
+                      channels, RATE, RATE * block, block, bits)
+    if extensible:
+        fmt += struct.pack("<HHIH14s", 22, bits, 3, tag, b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71")
+    chunks = (b"fmt " + struct.pack("<I", len(fmt)) + fmt
+              + b"LIST" + struct.pack("<I", 3) + b"abc\x00"  # odd-sized chunk, padded
+              + b"data" + struct.pack("<I", len(payload)) + payload)
+    return b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks
+
+
+@pytest.fixture
+def stereo():
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((500, 2)) * 8000).clip(-32768, 32767).astype(np.int16)
+
+
+def encode(samples, tag, bits):
+    if tag == WAVE_FORMAT_IEEE_FLOAT:
+        return (samples / 32767).astype(f"<f{bits // 8}").tobytes()
+    if bits == 24:
+        packed = np.zeros((samples.size, 3), dtype=np.uint8)
+        packed[:, 0] = 0x5a  # low byte is dropped
+        packed[:, 1:] = samples.reshape(-1).astype("<i2").view(np.uint8).reshape(-1, 2)
+        return packed.tobytes()
+    if bits == 32:
+        return (samples.astype("<i4") << 16).tobytes()
+    return samples.astype("<i2").tobytes()
+
+
+@pytest.mark.parametrize("extensible", [False, True])
+@pytest.mark.parametrize("tag, bits", [
+    (WAVE_FORMAT_PCM, 16), (WAVE_FORMAT_PCM, 24), (WAVE_FORMAT_PCM, 32),
+    (WAVE_FORMAT_IEEE_FLOAT, 32), (WAVE_FORMAT_IEEE_FLOAT, 64),
+])
+def test_load_audio_decodes_wav(tmp_path, stereo, tag, bits, extensible):
+    path = tmp_path / "in.wav"
+    path.write_bytes(wav(tag, bits, encode(stereo, tag, bits), extensible=extensible))
+    samples, rate = load_audio(str(path))
+    assert rate == RATE
+    expected = stereo.astype(np.int32).mean(axis=1).astype(np.int16)
+    assert np.abs(samples.astype(int) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("data", [
+    wav(2, 4, b"\x00" * 64),  # ADPCM
+    wav(WAVE_FORMAT_PCM, 48, b"\x00" * 96),
+    b"RIFF\x04\x00\x00\x00WAVE",
+])
+def test_load_audio_rejects_undecodable_wav(tmp_path, data):
+    path = tmp_path / "in.wav"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        load_audio(str(path))
+
+
+def test_load_audio_reads_raw_pcm(tmp_path):
+    path = tmp_path / "in.raw"
+    path.write_bytes(np.arange(-5, 5, dtype="<i2").tobytes() + b"\x01")
+    samples, rate = load_audio(str(path))
+    assert rate == 22050
+    assert samples.tolist() == list(range(-5, 5))
+
+
+def test_cast_events_have_no_bare_line_feeds(tmp_path):
+    engine = AudioEngine(78, window_size=512)
+    samples = (np.sin(np.arange(22050) * 0.05) * 8000).astype(np.int16)
+    out = tmp_path / "out.cast"
+    count, _ = render_offline(engine, samples, SKINS["blocks"](22, 78), str(out), 80, 24)
+    header, *events = [json.loads(line) for line in out.read_text().splitlines()]
+    assert header["width"] == 80 and len(events) == count + 1
+    for _, kind, text in events:
+        assert kind == "o"
+        assert "\n" not in text.replace("\r\n", "")
+    assert events[1][2].count("\r\n") == 21
@@ -0,0 +1,45 @@
+import select
+import threading
+
+from core.pipeline import Mailbox
+
+
+def readable(mailbox, timeout=0.0):
+    return bool(select.select([mailbox], [], [], timeout)[0])
+
+
+def test_mailbox_wakes_reader_on_put():
+    mailbox = Mailbox()
+    try:
+        assert mailbox.get() == (0, None)
+        assert not readable(mailbox)
+        mailbox.put("a")
+        mailbox.put("b")
+        assert readable(mailbox)
+        assert mailbox.get() == (2, "b")
+        assert not readable(mailbox)
+    finally:
+        mailbox.close()
+
+
+def test_mailbox_put_from_another_thread_ends_the_wait():
+    mailbox = Mailbox()
+    try:
+        timer = threading.Timer(0.05, mailbox.put, ["spectrum"])
+        timer.start()
+        assert readable(mailbox, timeout=5.0)
+        assert mailbox.get() == (1, "spectrum")
+        timer.join()
+    finally:
+        mailbox.close()
+
+
+def test_mailbox_put_never_blocks():
+    mailbox = Mailbox()
+    try:
+        for i in range(200000):  # far more wakeups than a pipe holds
+            mailbox.put(i)
+        assert mailbox.get() == (200000, 199999)
+        assert not readable(mailbox)
+    finally:
+        mailbox.close()
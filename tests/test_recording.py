@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from core.recording import EnergyRecorder, ReplayThread, load_recording, resample
+
+
+@pytest.mark.parametrize("value_type, tolerance", [("uint8", 0.5 / 255), ("float16", 1e-3)])
+def test_recording_round_trip(tmp_path, value_type, tolerance):
+    path = tmp_path / "energies.rec"
+    rng = np.random.default_rng(1)
+    written = rng.random((5, 12))
+    with EnergyRecorder(str(path), 12, value_type) as recorder:
+        for i, energies in enumerate(written):
+            recorder.write(energies, seconds=i * 0.04)
+    seconds, energies = load_recording(str(path))
+    np.testing.assert_allclose(seconds, np.arange(5) * 0.04, atol=1e-3)
+    np.testing.assert_allclose(energies, written, atol=tolerance)
+
+
+def test_empty_recording(tmp_path):
+    path = tmp_path / "empty.rec"
+    EnergyRecorder(str(path), 12).close()
+    seconds, energies = load_recording(str(path))
+    assert seconds.shape == (0,) and energies.shape == (0, 12)
+    assert resample(energies, 30).shape == (0, 30)
+    assert len(ReplayThread(str(path), 30).times) == 0
+
+
+@pytest.mark.parametrize("data", [b"", b"BBLIP", b"not a recording at all"])
+def test_load_recording_rejects_other_files(tmp_path, data):
+    path = tmp_path / "other.rec"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        load_recording(str(path))
+
+
+def test_resample_interpolates_bands():
+    energies = np.array([[0.0, 1.0], [1.0, 0.0]])
+    np.testing.assert_allclose(resample(energies, 3), [[0.0, 0.5, 1.0], [1.0, 0.5, 0.0]])
+    np.testing.assert_array_equal(resample(energies, 2), energies)
@@ -0,0 +1,89 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.display import _keeps_blanks, parse_cells
+from skins import SKINS
+from . import scalar_skins
+
+SIZES = [(6, 9), (13, 31), (24, 80)]  # rows, columns
+FRAMES = 6
+
+REFERENCES = {
+    "tunnel": scalar_skins.TunnelSkin,
+    "hexgrid": scalar_skins.HexGridSkin,
+    "neuronet": scalar_skins.NeuroNetSkin,
+    "moirefield": scalar_skins.MoireFieldSkin,
+    "plasmastorm": scalar_skins.PlasmaStormSkin,
+    "harmonicfield": scalar_skins.HarmonicFieldSkin,
+    "cymatic": scalar_skins.CymaticSkin,
+    "hexwarp": scalar_skins.HexWarpSkin,
+    "diamondwave": scalar_skins.DiamondWaveSkin,
+    "fractallattice": scalar_skins.FractalLatticeSkin,
+    "quantumwave": scalar_skins.QuantumWaveSkin,
+}
+
+
+def cells(screen):
+    # how the frame looks: blanks drawn in a style that leaves them blank
+    # are the same whatever escape codes surround them
+    return [[("", " ") if ch == " " and _keeps_blanks(attr) else (attr, ch) for attr, ch in parse_cells(line)]
+            for line in screen]
+
+
+def spectra(num_bands, frames=FRAMES, seed=3, gain=1.6, level=None):
+    """Smoothed random spectra, or a flat spectrum at `level` when given."""
+    rng = np.random.default_rng(seed)
+    energies = np.zeros(num_bands)
+    for _ in range(frames):
+        if level is None:
+            energies = np.clip(0.7 * energies + 0.3 * gain * rng.random(num_bands), 0.0, 1.0)
+        else:
+            energies = np.full(num_bands, level)
+        yield energies.copy()
+
+
+def assert_same_frames(name, rows, cols, num_bands=None, **spectrum):
+    """Render the same spectra through the skin and its per-cell reference."""
+    skin = SKINS[name](rows, cols)
+    reference = REFERENCES[name](rows, cols)
+    for frame, energies in enumerate(spectra(cols if num_bands is None else num_bands, **spectrum)):
+        random.seed(frame)
+        expected = cells(reference.render(energies.copy()))
+        random.seed(frame)
+        actual = cells(skin.render(energies.copy()))
+        assert actual == expected, f"{name} at {cols}x{rows}, frame {frame}"
+
+
+@pytest.mark.parametrize("rows, cols", SIZES)
+@pytest.mark.parametrize("name", sorted(REFERENCES))
+def test_matches_scalar_skin(name, rows, cols):
+    assert_same_frames(name, rows, cols)
+
+
+@pytest.mark.parametrize("num_bands", [1, 37])
+@pytest.mark.parametrize("name", sorted(REFERENCES))
+def test_matches_scalar_skin_with_other_band_counts(name, num_bands):
+    assert_same_frames(name, 13, 31, num_bands)
+
+
+@pytest.mark.parametrize("name", ["hexwarp", "diamondwave", "fractallattice"])
+def test_matches_scalar_skin_without_bands(name):
+    assert_same_frames(name, 13, 31, 0)
+
+
+def test_quantumwave_without_bands_draws_silence():
+    # the per-cell version divided by zero here; an empty spectrum now
+    # draws the same frames as a silent one
+    skin = SKINS["quantumwave"](13, 31)
+    reference = REFERENCES["quantumwave"](13, 31)
+    for _ in range(FRAMES):
+        assert cells(skin.render(np.zeros(0))) == cells(reference.render(np.zeros(31)))
+
+
+@pytest.mark.parametrize("level", [0.1, 0.3, 0.55, 0.8, 1.0])
+def test_fractallattice_at_every_depth(level):
+    # a flat spectrum at `level` sets the Sierpinski depth to int(level * 4) + 1,
+    # up to 5; bit 5 of x & y needs a canvas past 32 cells in both directions
+    assert_same_frames("fractallattice", 40, 70, level=level, frames=2)